@@ -22,7 +22,9 @@ def error_handler(exc_type, exc_value, exc_traceback) -> None:
     It takes the exception type, exception instance, and traceback as input parameters.
     The error message dialog shows the error message and provides a detailed text with the traceback information.
     """
-    error_message = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+    # locals are not captured explicitly, so the message never contains the repr of (large) signal arrays
+    traceback_exception = traceback.TracebackException(exc_type, exc_value, exc_traceback, capture_locals=False)
+    error_message = "".join(traceback_exception.format())
     error_dialog = QMessageBox()
     error_dialog.setWindowTitle("An error occurred.")
     error_dialog.setText("An unexpected error occurred. For support, open an Issue on the pod5Viewer Github page with the error message.")
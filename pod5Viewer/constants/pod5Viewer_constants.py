@@ -1,5 +1,9 @@
 WINDOW_TITLE = "pod5Viewer"
 WINDOW_GEOMETRY = (100, 100, 1200, 800) 
+PREVIEW_DELAY_MS = 50
+EXPORT_TXT_CHUNK_SIZE = 100000
+PREVIEW_NUM_VALUES = 100
+TAB_CACHE_SIZE = 16
 SHORTCUT_HELP_TEXT = """<center>
         <b>Shortcuts</b>
     </center>
@@ -28,6 +32,7 @@ SHORTCUT_HELP_TEXT = """<center>
         <br>Arrow up: Scroll up
     """
 
+NO_HELP_STRING = "No docstring available"
 HELP_STRINGS = {
     "byte_count": "Number of bytes used to store the reads data",
     "calibration": "Calibration data associated with the read",
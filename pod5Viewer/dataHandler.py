@@ -1,7 +1,18 @@
-from typing import Dict, Any, List
-import pod5, pathlib, datetime, uuid, numpy as np, tempfile, os
+from typing import Dict, Any, List, Tuple
+import os, tempfile
+
+# pod5 migrates files of older format versions via temporary directories that are created in the
+# working directory (which might not be writable) unless POD5_MIGRATION_TMP_DIR is set. The variable
+# is read when pod5 is imported, so it is set beforehand instead of changing the working directory
+# whenever files are opened.
+os.environ.setdefault("POD5_MIGRATION_TMP_DIR", tempfile.gettempdir())
+
+import pod5, pathlib, datetime, uuid, threading, numpy as np
 from pod5.pod5_types import EndReasonEnum
 
+# types of members that members_to_dict stores as they are (checked via isinstance)
+PLAIN_MEMBER_TYPES = (float, int, str, bool, dict, datetime.datetime, uuid.UUID, np.ndarray)
+
 
 class DataHandler:
     """
@@ -10,6 +21,9 @@ class DataHandler:
     Attributes:
         pod5_paths (List[pathlib.Path]): A list of file paths to the POD5 files.
         pod5_ids_to_path (Dict[str, List[str]]): A dictionary mapping POD5 file IDs to their respective paths.
+        reader_lock (threading.Lock): Serializes the access to the files. Reads are loaded in background 
+            threads as well as in the GUI thread, but the dataset reader and the readers it caches must not 
+            be used by multiple threads at once.
 
     Methods:
         ids_to_path() -> Dict[str, List[str]]:
@@ -23,19 +37,35 @@ class DataHandler:
 
         process_signal_rows(sig_rows: list[pod5.reader.SignalRowInfo]) -> Dict[str, Any]:
             Processes signal row information into a dictionary format.
+
+        get_signal(read_data: Dict[str, Any], in_pa: bool) -> np.ndarray:
+            Returns the (pA) signal of loaded read data, calculating the pA signal on request.
+
+        calibrate_signal(read_data: Dict[str, Any], signal: np.ndarray) -> np.ndarray:
+            Converts (part of) a raw signal to pA using the calibration of the read.
     """
     pod5_paths: List[pathlib.Path]
     pod5_ids_to_path: Dict[str, List[str]]
+    reader_lock: threading.Lock
+
+    # members that are not loaded by members_to_dict, but calculated whenever they are needed.
+    # the key is kept (with None as value) to retain the order of the members
+    LAZY_MEMBERS = ("signal_pa",)
+
+    # names of the members that members_to_dict loads, determined once per type of object
+    __members_cache: Dict[type, Tuple[str, ...]] = {}
 
     def __init__(self, pod5_paths: List[pathlib.Path]) -> None:
         """
-        Initializes the DataHandler with a list of POD5 file paths.
+        Initializes the DataHandler with a list of POD5 file paths. Relative paths are made absolute,
+        so the files are found independent of later changes of the working directory.
 
         Args:
             pod5_paths (List[pathlib.Path]): List of pathlib.Path objects representing POD5 file paths.
         """
-        self.pod5_paths = pod5_paths
-        self.dataset_reader = pod5.DatasetReader(pod5_paths)
+        self.pod5_paths = [pathlib.Path(path).absolute() for path in pod5_paths]
+        self.dataset_reader = pod5.DatasetReader(self.pod5_paths)
+        self.reader_lock = threading.Lock()
 
 
     def ids_to_path(self) -> Dict[str, List[str]]:
@@ -45,18 +75,8 @@ class DataHandler:
         Returns:
             Dict[str, List[str]]: A dictionary where keys are file paths (as strings) and values are lists of read IDs.
         """
-        original_cwd = os.getcwd()
-        temp_dir = tempfile.gettempdir()
-        try:
-            os.chdir(temp_dir)
-            file_paths = self.dataset_reader.paths
-            id_path_dict = dict(zip([str(file) for file in file_paths],
-                                    [self.dataset_reader.get_reader(file).read_ids for file in file_paths]))
-            return id_path_dict
-        except Exception as e:
-            raise e
-        finally:    
-            os.chdir(original_cwd)
+        with self.reader_lock:
+            return {str(file): self.dataset_reader.get_reader(file).read_ids for file in self.dataset_reader.paths}
 
     
     def load_read_data(self, read_id: str) -> Dict[str, Any]:
@@ -69,14 +89,18 @@ class DataHandler:
         Returns:
             Dict[str, Any]: A dictionary containing the read data.
         """
-        read_record = self.dataset_reader.get_read(read_id)
-        return self.members_to_dict(read_record)
+        # the members of a record (e.g. the signal) are read from the file when they are accessed,
+        # so the lock is held until the record is converted
+        with self.reader_lock:
+            read_record = self.dataset_reader.get_read(read_id)
+            return self.members_to_dict(read_record)
 
     def members_to_dict(self, obj) -> Dict[str, Any]:
         """
         Converts an object's attributes to a dictionary, handling various types of attributes.
-        Dictionary can be nested, as the method can be called recursively. In case an attribute
-        can not be loaded, fills the value with the error message for that attribute.
+        Dictionary can be nested, as attributes can be objects themselves. Nested objects are
+        processed via a stack instead of recursion. In case an attribute can not be loaded, 
+        fills the value with the error message for that attribute.
 
         Args:
             obj (Any): The object whose attributes need to be converted.
@@ -84,26 +108,51 @@ class DataHandler:
         Returns:
             Dict[str, Any]: A dictionary representation of the object's attributes.
         """
-        obj_dict = {}
-
-        members = [attr for attr in dir(obj) if not callable(getattr(obj, attr)) and not attr.startswith("_")]
-
-        for member in members: 
-            try:
-                member_value = getattr(obj, member)
-                if member == "signal_rows":
-                    obj_dict[member] = self.process_signal_rows(member_value)
-                elif type(member_value) in [float, int, str, bool, dict, datetime.datetime, uuid.UUID, np.ndarray]:
-                    obj_dict[member] = member_value
-                # implemented to fix recursion error on MacOS:
-                elif type(member_value) == EndReasonEnum: 
-                    return {"name": member_value.name, "value": member_value.value}
-                else:
-                    obj_dict[member] = self.members_to_dict(member_value)
-            except Exception as e:
-                obj_dict[member] = f"ERROR: {e}"
-
-        return obj_dict
+        result = {}
+        # stack of (dict containing the object, key of the object, object, members of the object)
+        stack = [(result, "", obj, self.__get_members(obj))]
+
+        while stack:
+            parent_dict, key, obj, members = stack.pop()
+            obj_dict = {}
+            parent_dict[key] = obj_dict
+
+            for member in members: 
+                if member in self.LAZY_MEMBERS:
+                    obj_dict[member] = None
+                    continue
+                try:
+                    member_value = getattr(obj, member)
+                    # most members are plain values, so they are checked first
+                    if isinstance(member_value, PLAIN_MEMBER_TYPES):
+                        obj_dict[member] = member_value
+                    elif member == "signal_rows":
+                        obj_dict[member] = self.process_signal_rows(member_value)
+                    # implemented to fix recursion error on MacOS:
+                    elif type(member_value) == EndReasonEnum: 
+                        parent_dict[key] = {"name": member_value.name, "value": member_value.value}
+                        break
+                    else:
+                        # the placeholder keeps the order of the members, it is replaced once the object is processed
+                        obj_dict[member] = None
+                        stack.append((obj_dict, member, member_value, self.__get_members(member_value)))
+                except Exception as e:
+                    obj_dict[member] = f"ERROR: {e}"
+
+        return result[""]
+
+    def __get_members(self, obj) -> Tuple[str, ...]:
+        """
+        Returns the names of the members of an object that get loaded by members_to_dict 
+        (i.e. public attributes that are not methods, plus the LAZY_MEMBERS). The names are 
+        determined once per type of object.
+        """
+        members = DataHandler.__members_cache.get(type(obj))
+        if members is None:
+            members = tuple(attr for attr in dir(obj) if not attr.startswith("_") and 
+                            (attr in self.LAZY_MEMBERS or not callable(getattr(obj, attr))))
+            DataHandler.__members_cache[type(obj)] = members
+        return members
 
     def process_signal_rows(self, sig_rows: list[pod5.reader.SignalRowInfo]) -> Dict[str, Any]:
         """
@@ -121,3 +170,46 @@ class DataHandler:
             row_dict[str(i)] = self.members_to_dict(row)
         return row_dict
 
+    def get_signal(self, read_data: Dict[str, Any], in_pa: bool = False) -> np.ndarray:
+        """
+        Returns the signal of loaded read data. The pA signal is not calculated when loading 
+        a read; it is calculated on each request and not stored in the read data. This way an 
+        opened read only holds the raw signal (int16) instead of both signals. Calculating
+        it again is a single vectorized operation.
+
+        Args:
+            read_data (Dict[str, Any]): Data of a read as returned by load_read_data.
+            in_pa (bool): True to return the signal in pA.
+
+        Returns:
+            np.ndarray: The raw signal or the signal in pA.
+
+        Raises:
+            ValueError: If the signal could not be loaded or converted to pA.
+        """
+        signal = read_data["signal"]
+        if not isinstance(signal, np.ndarray):
+            # members that can not be loaded are stored as error message by members_to_dict
+            raise ValueError(f"The signal could not be loaded ({signal})")
+        if not in_pa:
+            return signal
+        try:
+            return self.calibrate_signal(read_data, signal)
+        except Exception as e:
+            raise ValueError(f"The signal could not be converted to pA ({e})") from e
+
+    def calibrate_signal(self, read_data: Dict[str, Any], signal: np.ndarray) -> np.ndarray:
+        """
+        Converts a raw signal (or a part of it) to pA in the same way as pod5 does for 
+        ReadRecord.signal_pa.
+
+        Args:
+            read_data (Dict[str, Any]): Data of a read as returned by load_read_data.
+            signal (np.ndarray): (Part of the) raw signal of that read.
+
+        Returns:
+            np.ndarray: The signal in pA (float32).
+        """
+        offset = np.float32(read_data["calibration"]["offset"])
+        scale = np.float32(read_data["calibration"]["scale"])
+        return (signal + offset) * scale
@@ -0,0 +1,240 @@
+from PySide6.QtCore import (Qt, QAbstractItemModel, QModelIndex,
+                            QPersistentModelIndex)
+from typing import Dict, List, Any
+
+try:
+    from pod5Viewer.constants.pod5Viewer_constants import HELP_STRINGS, NO_HELP_STRING
+except ModuleNotFoundError:
+    from constants.pod5Viewer_constants import HELP_STRINGS, NO_HELP_STRING
+
+
+class TreeNode:
+    """
+    A single node (i.e. one row) in the DataTreeModel.
+
+    Attributes:
+        key (str): The key shown in the first column.
+        value (Any): The raw value shown in the second column. For nodes with children this is
+            the nested dictionary.
+        help_str (str): Tooltip text for the key.
+        parent (TreeNode | None): Parent node. None for the root node.
+        children (List[TreeNode] | None): Child nodes in the order they are shown. None until 
+            they are requested for the first time.
+        row (int): Row of the node within its parent.
+        help_prefix (str): Space-separated keys leading to the node. Prefix of the HELP_STRINGS keys 
+            of its children.
+    """
+    __slots__ = ("key", "value", "help_str", "parent", "children", "row", "help_prefix")
+
+    def __init__(self, key: str, value: Any, help_str: str, parent: "TreeNode | None" = None, 
+                 row: int = 0, help_prefix: str = "") -> None:
+        """
+        Initializes a node without children.
+        """
+        self.key = key
+        self.value = value
+        self.help_str = help_str
+        self.parent = parent
+        self.children: List[TreeNode] | None = None
+        self.row = row
+        self.help_prefix = help_prefix
+
+
+class DataTreeModel(QAbstractItemModel):
+    """
+    A read-only tree model for displaying the (nested) data of a read in a QTreeView.
+
+    Instead of creating a QStandardItem for every key and value, the model keeps one
+    lightweight TreeNode per dictionary entry and references the original values. The
+    nodes of a nested dictionary are only created when the view requests them (i.e. when
+    the branch gets expanded) and the text shown in the value column is only created for
+    the visible rows.
+
+    Attributes:
+        _root (TreeNode): Invisible root node containing the top-level entries.
+
+    Methods:
+        __init__(data, parent): Creates the root node for the given data.
+        populate_node(node): Creates the child nodes of a node.
+        index(row, column, parent): Returns the index of the given row and column below the parent.
+        parent(index): Returns the index of the parent of the given index.
+        hasChildren(parent): Returns whether the parent has children without creating them.
+        rowCount(parent): Returns the number of children of the parent.
+        columnCount(parent): Returns the number of columns (key and value).
+        data(index, role): Returns the text or tooltip for a given index.
+        headerData(section, orientation, role): Returns the column headers.
+        flags(index): Returns the item flags (enabled and selectable, not editable).
+    """
+    HEADER_LABELS = ("Key", "Value")
+
+    def __init__(self, data: Dict[str, Any], parent=None) -> None:
+        """
+        Initializes the model with the data of a read.
+
+        Args:
+            data (Dict[str, Any]): The data to be displayed, structured as a dictionary. Expected to be
+                prepared by Pod5Viewer.transform_data, i.e. without numpy arrays.
+            parent: The parent object, if any. Defaults to None.
+        """
+        super().__init__(parent)
+        self._root = TreeNode("", data, "")
+
+    def populate_node(self, node: TreeNode) -> List[TreeNode]:
+        """
+        Creates the child nodes of a node containing a nested dictionary. The tooltip of each 
+        child is looked up in HELP_STRINGS using the keys leading to it.
+
+        Args:
+            node (TreeNode): The node whose children are created.
+
+        Returns:
+            List[TreeNode]: The created child nodes.
+        """
+        children = []
+        if isinstance(node.value, dict):
+            for row, (key, value) in enumerate(node.value.items()):
+                help_key = node.help_prefix + " " + key if node.help_prefix else key
+                # all nodes without an entry share the same default string object
+                help_str = HELP_STRINGS.get(help_key) or NO_HELP_STRING
+                # if statement to catch the individual signal_rows entries (need 'signal_rows <key>' without number)
+                help_prefix = node.help_prefix if key.isdigit() else help_key
+                children.append(TreeNode(key, value, help_str, node, row, help_prefix))
+        node.children = children
+        return children
+
+    def __children(self, node: TreeNode) -> List[TreeNode]:
+        """
+        Returns the child nodes of a node and creates them on the first request.
+        """
+        if node.children is None:
+            return self.populate_node(node)
+        return node.children
+
+    def __node(self, index: QModelIndex | QPersistentModelIndex) -> TreeNode:
+        """
+        Returns the node of a given index. Invalid indices correspond to the root node.
+        """
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def index(self, row: int, column: int, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:
+        """
+        Returns the index of the item at the given row and column below the parent.
+
+        Args:
+            row (int): Row of the item.
+            column (int): Column of the item.
+            parent (QModelIndex, optional): Index of the parent item. Defaults to the root.
+
+        Returns:
+            QModelIndex: The index of the item or an invalid index if it does not exist.
+        """
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self.__children(self.__node(parent))[row])
+
+    def parent(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex: # type: ignore overrides QObject.parent as in the Qt tree model examples
+        """
+        Returns the index of the parent of the given index.
+
+        Args:
+            index (QModelIndex): Index of the child item.
+
+        Returns:
+            QModelIndex: Index of the parent or an invalid index for top-level items.
+        """
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+
+    def hasChildren(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> bool:
+        """
+        Returns whether the given parent has children. Does not create the child nodes, so 
+        the view can show the expand indicator of collapsed branches without populating them.
+
+        Args:
+            parent (QModelIndex, optional): Index of the parent item. Defaults to the root.
+
+        Returns:
+            bool: True if the parent contains a non-empty nested dictionary.
+        """
+        if parent.isValid() and parent.column() > 0:
+            return False
+        value = self.__node(parent).value
+        return isinstance(value, dict) and len(value) > 0
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Returns the number of children of the given parent. Only items in the first column
+        have children.
+
+        Args:
+            parent (QModelIndex, optional): Index of the parent item. Defaults to the root.
+
+        Returns:
+            int: Number of child rows.
+        """
+        if parent.isValid() and parent.column() > 0:
+            return 0
+        return len(self.__children(self.__node(parent)))
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Returns the number of columns (key and value).
+        """
+        return len(self.HEADER_LABELS)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Returns the data for a given index. The value text is created on request.
+
+        Args:
+            index (QModelIndex): The index of the item.
+            role (int, optional): The role to determine how data should be displayed. Defaults to Qt.DisplayRole.
+
+        Returns:
+            str | None: The key/value text or the tooltip, None otherwise.
+        """
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return node.key
+            # nodes containing nested data have no value
+            if node.value is None or isinstance(node.value, dict):
+                return None
+            # arrays were already converted by transform_data, so all leaves are plain Python values
+            return str(node.value)
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 0:
+            return node.help_str
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Returns the column headers.
+
+        Args:
+            section (int): The column number.
+            orientation (Qt.Orientation): Only horizontal headers are provided.
+            role (int, optional): The role for header display. Defaults to Qt.DisplayRole.
+
+        Returns:
+            str | None: The header label or None.
+        """
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADER_LABELS[section]
+        return None
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        """
+        Returns the item flags. Items can be selected, but not edited.
+        """
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
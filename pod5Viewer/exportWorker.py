@@ -0,0 +1,66 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+from typing import Callable
+
+
+class ExportSignals(QObject):
+    """
+    Signals emitted by ExportRunnable objects. QRunnable is not a QObject, so the signals are
+    kept in a separate object that is shared by all runnables of one export. The object lives
+    in the GUI thread, so the connected slots are called there as well.
+
+    Attributes:
+        written (Signal(str)): Emitted with the path of a file after it was written.
+        failed (Signal(str, str)): Emitted with the path of a file that could not be written and 
+            the reason (e.g. missing permissions or a signal that could not be converted).
+    """
+    written = Signal(str)
+    failed = Signal(str, str)
+
+
+class ExportRunnable(QRunnable):
+    """
+    Writes the data of one read to a file in a thread of a QThreadPool, so exporting many reads
+    does not block the event loop.
+
+    Attributes:
+        filepath (str): Path to the output file.
+        get_bytes (Callable[[], bytes]): Returns the content that gets written to the file.
+        signals (ExportSignals): Signals used to report the result of the export.
+    """
+    filepath: str
+    get_bytes: Callable[[], bytes]
+    signals: ExportSignals
+
+    def __init__(self, filepath: str, get_bytes: Callable[[], bytes], signals: ExportSignals) -> None:
+        """
+        Initializes the runnable.
+
+        Args:
+            filepath (str): Path to the output file.
+            get_bytes (Callable[[], bytes]): Returns the content that gets written to the file.
+                Called in the worker thread.
+            signals (ExportSignals): Signals used to report the result of the export.
+        """
+        super().__init__()
+        self.filepath = filepath
+        self.get_bytes = get_bytes
+        self.signals = signals
+
+    def run(self) -> None:
+        """
+        Creates the content and writes it to the output file. Emits written on success and
+        failed if the content cannot be created or the file cannot be written. Every runnable
+        emits exactly one of both signals, as the receiver counts them to detect the end of
+        the export.
+        """
+        try:
+            content = self.get_bytes()
+            with open(self.filepath, "wb") as file:
+                file.write(content)
+        except PermissionError:
+            self.signals.failed.emit(self.filepath, f"You do not have permissions to write to path {self.filepath}")
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.filepath, f"{self.filepath} could not be written. {e}")
+            return
+        self.signals.written.emit(self.filepath)
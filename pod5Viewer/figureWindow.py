@@ -29,6 +29,26 @@ except ModuleNotFoundError:
                                                   HELP_TEXT)
 
 
+def bin_medians(y: np.ndarray, bin_size: int) -> np.ndarray:
+    """
+    Splits the data into consecutive bins of a given size and calculates the median of each bin.
+    The last bin contains the remaining values if the length is not a multiple of the bin size.
+    All full bins are processed in one call on a 2D view of the data instead of one call per bin.
+
+    Args:
+        y (np.ndarray): 1D array of values
+        bin_size (int): Number of values per bin
+
+    Returns:
+        np.ndarray: Median of each bin
+    """
+    num_full_bins = len(y) // bin_size
+    medians = np.median(y[:num_full_bins*bin_size].reshape(num_full_bins, bin_size), axis=1)
+    if len(y) % bin_size > 0:
+        medians = np.append(medians, np.median(y[num_full_bins*bin_size:]))
+    return medians
+
+
 class OverviewWidget(QWidget):
     """
     A widget that provides an overview of data samples with zooming capabilities.
@@ -126,7 +146,7 @@ class OverviewWidget(QWidget):
 
             if len(x) > bin_count:
                 x_subset = x[::bin_size]
-                y_subset = np.array([np.median(y[i:i+bin_size]) for i in range(0, len(y), bin_size)])
+                y_subset = bin_medians(y, bin_size)
                 data_subset[read_id] = (x_subset,y_subset,c)
             else:
                 data_subset[read_id] = (x,y,c)
@@ -476,9 +496,9 @@ class FigureWindow(QMainWindow):
         for read_id, signal in data_sorted.items():
             color = next(colors)
             # add NAs to fill all arrays to the same length (avoids indexing errors when zooming)
+            # float32 padding keeps int16 and pA (float32) signals at 32 bit instead of upcasting to float64
             if len(signal) < max_len:
-                rest = np.empty(max_len-len(signal))
-                rest[:] = np.nan
+                rest = np.full(max_len-len(signal), np.nan, dtype=np.float32)
                 signal = np.concatenate((signal, rest))
             x_vals = np.arange(max_len)
 
@@ -493,7 +513,8 @@ class FigureWindow(QMainWindow):
     def normalize(self, data: np.ndarray) -> np.ndarray:
         """
         Normalizes the provided data by subtracting the mean and dividing by the standard deviation
-        (z-score normalization).
+        (z-score normalization). The normalized data is returned as float32, which is precise enough
+        for plotting and halves the memory compared to float64.
 
         Args:
             data (np.ndarray): Array of data points to normalize.
@@ -502,9 +523,13 @@ class FigureWindow(QMainWindow):
             np.ndarray: Normalized data.
         """
         try:
-            norm_data = (data - np.nanmean(data)) / np.nanstd(data)
+            # the copy is normalized in place, so no further temporary arrays are allocated
+            norm_data = data.astype(np.float32, copy=True)
+            mean, std = np.float32(np.nanmean(norm_data)), np.float32(np.nanstd(norm_data))
+            norm_data -= mean
+            norm_data /= std
         except:
-            norm_data = np.zeros(len(data))
+            norm_data = np.zeros(len(data), dtype=np.float32)
         return norm_data
 
     def init_ui(self) -> None:
@@ -665,7 +690,7 @@ class FigureWindow(QMainWindow):
             self.update_subset_label(bin_size)
 
             x_subsampled = x[::bin_size]
-            y_subsampled = np.array([np.median(y[i:i+bin_size]) for i in range(0, len(y), bin_size)])
+            y_subsampled = bin_medians(y, bin_size)
             return x_subsampled, y_subsampled
 
         for read_id, (x, y, c) in self.get_current_data().items():
@@ -1,7 +1,12 @@
-from PySide6.QtWidgets import (QHBoxLayout, QVBoxLayout, QWidget, QTreeWidget, 
-                               QTreeWidgetItem, QLineEdit, QPushButton, QStyle)
-from PySide6.QtCore import Qt, Signal
-from typing import List, Dict
+from PySide6.QtWidgets import (QHBoxLayout, QVBoxLayout, QWidget, QTreeView, 
+                               QLineEdit, QPushButton, QStyle)
+from PySide6.QtCore import Signal, QModelIndex
+from typing import List, Dict, Callable
+
+try:
+    from pod5Viewer.fileTreeModel import FileTreeModel
+except ModuleNotFoundError:
+    from fileTreeModel import FileTreeModel
 
 
 class FileNavigator(QWidget):
@@ -28,16 +33,22 @@ class FileNavigator(QWidget):
         sort_reads_button (QPushButton): Button for changing the sort order of the reads
         sort_order_reads_asc (bool): bool indicating if the sort order of the reads 
             is currently ascending
-        file_navigator (QTreeWidget): TreeWidget containing file paths (top-level items) and
+        file_navigator (QTreeView): TreeView showing file paths (top-level items) and
             read IDs (children of corresponding top-level items)
+        model (FileTreeModel): Model of the file_navigator. Holds the paths and read IDs and 
+            hands the read IDs of a file to the view once it is expanded.
+        itemSelectionChanged (Signal()): Emitted when the selected item changes.
+        readDoubleClicked (Signal(str)): Emitted with the read ID when a read is double clicked.
+        readActivated (Signal(str)): Emitted with the read ID when a read is activated.
     """
 
     reads_of_interest: List[str] | None
     search_string: str | None
+    model: FileTreeModel
 
     itemSelectionChanged = Signal()
-    itemDoubleClicked = Signal(QTreeWidgetItem, int)
-    itemActivated = Signal(QTreeWidgetItem, int)
+    readDoubleClicked = Signal(str)
+    readActivated = Signal(str)
     
     def __init__(self) -> None:
         """
@@ -54,9 +65,13 @@ class FileNavigator(QWidget):
         """
         user_input_layout = self.init_user_input_widgets()
 
-        # set up tree widget
-        self.file_navigator = QTreeWidget()
+        # set up tree view
+        self.file_navigator = QTreeView()
         self.file_navigator.setHeaderHidden(True)
+        # all rows contain a single line of text, so the view does not need to measure each row
+        self.file_navigator.setUniformRowHeights(True)
+        self.model = FileTreeModel(self.file_navigator)
+        self.file_navigator.setModel(self.model)
 
         # layout containing the rest of the widgets and the tree widget to the main layout 
         main_layout = QVBoxLayout()
@@ -102,11 +117,11 @@ class FileNavigator(QWidget):
         """
         Connect signals to slots.
         """        
-        # redirect the signals from the TreeWidget to the FileNavigator parent
+        # redirect the signals from the TreeView to the FileNavigator parent
         # so it can be accessed directly from the outside
-        self.file_navigator.itemSelectionChanged.connect(self.itemSelectionChanged)
-        self.file_navigator.itemDoubleClicked.connect(self.itemDoubleClicked)
-        self.file_navigator.itemActivated.connect(self.itemActivated)
+        self.file_navigator.selectionModel().selectionChanged.connect(self.itemSelectionChanged)
+        self.file_navigator.doubleClicked.connect(lambda index: self.__emit_read(self.readDoubleClicked, index))
+        self.file_navigator.activated.connect(lambda index: self.__emit_read(self.readActivated, index))
         # signals for search input
         self.search_input.textEdited.connect(self.update_search_str)
         self.clear_search_button.pressed.connect(self.clear_search)
@@ -115,30 +130,25 @@ class FileNavigator(QWidget):
         self.sort_reads_button.pressed.connect(self.sort_reads)
 
 
+    def __emit_read(self, signal: Signal, index: QModelIndex) -> None:
+        """
+        Emits the given signal with the read ID of the index. Nothing is emitted for files.
+        """
+        _, read_id = self.model.get_path_and_read_id(index)
+        if read_id is not None:
+            signal.emit(read_id)
+
     def load_data(self, id_path_dict: Dict[str, List[str]]) -> None:
         """
         Populates the file navigator with data from a dictionary mapping paths to read IDs.
+        The read IDs of a file are only handed to the view once the file gets expanded.
         
         Args:
             id_path_dict (Dict[str, List[str]]): A dictionary where each key is a path (string)
                                                  and each value is a list of read IDs (strings)
                                                  associated with that path.
         """
-        self.file_navigator.clear()
-
-        for path, items in id_path_dict.items():
-            path_item = QTreeWidgetItem([path])
-            path_item.setToolTip(0,path)
-            
-            for id_item in items:
-                id_tree_item = QTreeWidgetItem([id_item])
-
-                hide_item = self.hide_item(id_item)
-                id_tree_item.setHidden(hide_item)
-
-                path_item.addChild(id_tree_item)
-
-            self.file_navigator.addTopLevelItem(path_item)            
+        self.model.set_data(id_path_dict, self.__read_filter())
 
     def contains_data(self) -> bool:
         """
@@ -148,14 +158,26 @@ class FileNavigator(QWidget):
         Returns:
             bool: True if data has been loaded.
         """
-        return self.file_navigator.topLevelItemCount() >= 1
+        return self.model.rowCount() >= 1
+
+    def selected_read_id(self) -> str | None:
+        """
+        Returns the ID of the selected read.
+
+        Returns:
+            str | None: The read ID or None if no read (but a file or nothing) is selected.
+        """
+        selected_indexes = self.file_navigator.selectionModel().selectedIndexes()
+        if not selected_indexes:
+            return None
+        return self.model.get_path_and_read_id(selected_indexes[0])[1]
 
     def clear(self) -> None:
         """
         Clears all items from the file navigator tree.
         Resets search and filter attributes.
         """
-        self.file_navigator.clear()
+        self.model.set_data({})
         self.reads_of_interest = None
         self.search_string = None
 
@@ -192,16 +214,47 @@ class FileNavigator(QWidget):
 
     def update_view(self) -> None:
         """
-        Central method for updating the elements in the tree widget. Iterates through all 
-        elements and set fitting items to hidden based on the current search and filter 
-        status.
+        Central method for updating the elements in the tree view. Hides the reads that do not
+        fit the current search and filter status.
+        """
+        self.__update_model(lambda: self.model.set_filter(self.__read_filter()))
+
+    def __read_filter(self) -> Callable[[str], bool] | None:
+        """
+        Returns hide_item if a search or filter is active, None otherwise (i.e. all reads are shown).
+        """
+        if self.search_string is None and self.reads_of_interest is None:
+            return None
+        return self.hide_item
+
+    def __update_model(self, update: Callable[[], None]) -> None:
+        """
+        Applies a change that resets the model (filtering, sorting) and restores the expanded
+        files and the selected item afterwards. Restoring the selection does not emit 
+        itemSelectionChanged, as the selected item stays the same.
+
+        Args:
+            update (Callable[[], None]): Function applying the change to the model.
         """
-        for i in range(self.file_navigator.topLevelItemCount()):
-                for child_idx in range(self.file_navigator.topLevelItem(i).childCount()):
-                    child = self.file_navigator.topLevelItem(i).child(child_idx)
-                    
-                    hide_child = self.hide_item(child.text(0))
-                    child.setHidden(hide_child)
+        expanded_files = [path for row, path in enumerate(self.model.files) 
+                          if self.file_navigator.isExpanded(self.model.index(row, 0))]
+        current_path, current_read_id = self.model.get_path_and_read_id(self.file_navigator.currentIndex())
+
+        update()
+
+        for path in expanded_files:
+            self.file_navigator.expand(self.model.file_index(path))
+        if current_path is not None:
+            if current_read_id is None:
+                current_index = self.model.file_index(current_path)
+            else:
+                current_index = self.model.read_index(current_path, current_read_id)
+            if current_index.isValid():
+                self.blockSignals(True)
+                try:
+                    self.file_navigator.setCurrentIndex(current_index)
+                finally:
+                    self.blockSignals(False)
 
     def hide_item(self, item_str: str) -> bool:
         """
@@ -279,21 +332,7 @@ class FileNavigator(QWidget):
         
         This method preserves the expanded state of each top-level item before sorting and restores it after sorting.
         """
-        # take all top level items (i.e. file paths) and add them to a list for sorting
-        top_level_items = []
-        for _ in range(self.file_navigator.topLevelItemCount()):
-            # store the bool if it was expanded before sorting to retain that status
-            is_expanded = self.file_navigator.topLevelItem(0).isExpanded()
-            item = self.file_navigator.takeTopLevelItem(0)
-            top_level_items.append((item, is_expanded))
-
-        # sort top-level items
-        top_level_items.sort(key=lambda x: x[0].text(0), reverse=not ascending)
-
-        # re-insert the sorted top-level items back into the tree
-        for item, was_expanded in top_level_items:
-            self.file_navigator.addTopLevelItem(item)
-            self.file_navigator.topLevelItem(self.file_navigator.topLevelItemCount()-1).setExpanded(was_expanded)
+        self.__update_model(lambda: self.model.sort_files(ascending))
 
     def sort_child_items(self, ascending: bool = True) -> None:
         """
@@ -305,10 +344,4 @@ class FileNavigator(QWidget):
         
         This method sorts the children of each top-level item independently, based on the specified order.
         """
-        sort_order = Qt.SortOrder.AscendingOrder if ascending else Qt.SortOrder.DescendingOrder
-        for i in range(self.file_navigator.topLevelItemCount()):
-            parent_item = self.file_navigator.topLevelItem(i)
-            parent_item.sortChildren(0, sort_order)
-
-    def selectedItems(self) -> List[QTreeWidgetItem]:
-        return self.file_navigator.selectedItems()
\ No newline at end of file
+        self.__update_model(lambda: self.model.sort_reads(ascending))
@@ -0,0 +1,312 @@
+from PySide6.QtCore import (Qt, QAbstractItemModel, QModelIndex,
+                            QPersistentModelIndex)
+from typing import Dict, List, Callable, Tuple
+
+class FileTreeModel(QAbstractItemModel):
+    """
+    A read-only tree model for displaying the loaded files (top-level rows) and their read IDs
+    (children of the file rows) in a QTreeView.
+
+    The model only keeps the lists of paths and read IDs; no item object is created per read.
+    The read IDs of a file are handed to the view all at once (via canFetchMore/fetchMore) when
+    the file gets expanded, so collapsed files cost nothing. They are not fetched in batches,
+    because QTreeView only asks the expanded ancestors of its last visible row for more rows.
+    Reads that are hidden by the current filter are not part of the model.
+
+    Attributes:
+        files (List[str]): Paths of the loaded files in the order they are shown.
+        read_ids (Dict[str, List[str]]): All read IDs of each file in the order they are shown.
+        shown_read_ids (Dict[str, List[str]]): Read IDs of each file that are not hidden by the filter.
+        fetched (Dict[str, int]): Number of read IDs of each file that were handed to the view.
+
+    Methods:
+        set_data(id_path_dict, hide_read): Replaces the shown files and read IDs.
+        set_filter(hide_read): Hides the reads for which hide_read returns True.
+        sort_files(ascending): Sorts the files by their path.
+        sort_reads(ascending): Sorts the read IDs within each file.
+        get_path_and_read_id(index): Returns the path and read ID of an index.
+        file_index(path): Returns the index of a file.
+        read_index(path, read_id): Returns the index of a read, fetching it if needed.
+        index(row, column, parent): Returns the index of the given row and column below the parent.
+        parent(index): Returns the index of the parent of the given index.
+        hasChildren(parent): Returns whether the parent has children, fetched or not.
+        rowCount(parent): Returns the number of fetched children of the parent.
+        canFetchMore(parent): Returns whether a file has read IDs that were not fetched yet.
+        fetchMore(parent): Fetches all remaining read IDs of a file.
+        columnCount(parent): Returns the number of columns.
+        data(index, role): Returns the text or tooltip for a given index.
+        flags(index): Returns the item flags (enabled and selectable, not editable).
+    """
+    files: List[str]
+    read_ids: Dict[str, List[str]]
+    shown_read_ids: Dict[str, List[str]]
+    fetched: Dict[str, int]
+
+    def __init__(self, parent=None) -> None:
+        """
+        Initializes an empty model.
+
+        Args:
+            parent: The parent object, if any. Defaults to None.
+        """
+        super().__init__(parent)
+        self.files = []
+        self.read_ids = {}
+        self.shown_read_ids = {}
+        self.fetched = {}
+
+    def set_data(self, id_path_dict: Dict[str, List[str]], hide_read: Callable[[str], bool] | None = None) -> None:
+        """
+        Replaces the shown files and read IDs. Resets the model.
+
+        Args:
+            id_path_dict (Dict[str, List[str]]): A dictionary where each key is a path (string)
+                and each value is a list of read IDs (strings) associated with that path.
+            hide_read (Callable[[str], bool] | None): Returns True for read IDs that should be
+                hidden. None if all reads are shown.
+        """
+        self.beginResetModel()
+        self.files = list(id_path_dict)
+        # copies, so sorting does not change the lists of the caller
+        self.read_ids = {path: list(ids) for path, ids in id_path_dict.items()}
+        self.__apply_filter(hide_read)
+        self.endResetModel()
+
+    def set_filter(self, hide_read: Callable[[str], bool] | None) -> None:
+        """
+        Hides the reads for which hide_read returns True. Resets the model.
+
+        Args:
+            hide_read (Callable[[str], bool] | None): Returns True for read IDs that should be
+                hidden. None if all reads are shown.
+        """
+        self.beginResetModel()
+        self.__apply_filter(hide_read)
+        self.endResetModel()
+
+    def __apply_filter(self, hide_read: Callable[[str], bool] | None) -> None:
+        """
+        Determines the shown read IDs of each file. Nothing is fetched afterwards.
+        """
+        if hide_read is None:
+            # without a filter all reads are shown, so the lists can be shared
+            self.shown_read_ids = dict(self.read_ids)
+        else:
+            self.shown_read_ids = {path: [read_id for read_id in ids if not hide_read(read_id)]
+                                   for path, ids in self.read_ids.items()}
+        self.fetched = dict.fromkeys(self.files, 0)
+
+    def sort_files(self, ascending: bool = True) -> None:
+        """
+        Sorts the files by their path. Resets the model.
+
+        Args:
+            ascending (bool): If True, sorts the files in ascending order; otherwise in descending order.
+        """
+        self.beginResetModel()
+        self.files.sort(reverse=not ascending)
+        self.fetched = dict.fromkeys(self.files, 0)
+        self.endResetModel()
+
+    def sort_reads(self, ascending: bool = True) -> None:
+        """
+        Sorts the read IDs within each file. Resets the model.
+
+        Args:
+            ascending (bool): If True, sorts the reads in ascending order; otherwise in descending order.
+        """
+        self.beginResetModel()
+        for path in self.files:
+            self.read_ids[path].sort(reverse=not ascending)
+            # the shown list is a separate list if a filter is active
+            if self.shown_read_ids[path] is not self.read_ids[path]:
+                self.shown_read_ids[path].sort(reverse=not ascending)
+        self.fetched = dict.fromkeys(self.files, 0)
+        self.endResetModel()
+
+    def get_path_and_read_id(self, index: QModelIndex | QPersistentModelIndex) -> Tuple[str | None, str | None]:
+        """
+        Returns the path and the read ID of an index.
+
+        Args:
+            index (QModelIndex): Index of a file or read.
+
+        Returns:
+            Tuple[str | None, str | None]: The path of the file and the read ID. The read ID is None
+                for files; both are None for invalid indices.
+        """
+        if not index.isValid():
+            return None, None
+        if index.internalId() == 0:
+            return self.files[index.row()], None
+        path = self.files[index.internalId() - 1]
+        return path, self.shown_read_ids[path][index.row()]
+
+    def file_index(self, path: str) -> QModelIndex:
+        """
+        Returns the index of a file.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            QModelIndex: Index of the file or an invalid index if the file is not loaded.
+        """
+        try:
+            return self.index(self.files.index(path), 0)
+        except ValueError:
+            return QModelIndex()
+
+    def read_index(self, path: str, read_id: str) -> QModelIndex:
+        """
+        Returns the index of a read. Fetches the read IDs of the file if they were not
+        fetched yet.
+
+        Args:
+            path (str): Path of the file containing the read.
+            read_id (str): ID of the read.
+
+        Returns:
+            QModelIndex: Index of the read or an invalid index if the read is not shown.
+        """
+        parent = self.file_index(path)
+        if not parent.isValid():
+            return QModelIndex()
+        try:
+            row = self.shown_read_ids[path].index(read_id)
+        except ValueError:
+            return QModelIndex()
+        self.fetchMore(parent)
+        return self.index(row, 0, parent)
+
+    def index(self, row: int, column: int, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:
+        """
+        Returns the index of the item at the given row and column below the parent. The
+        internal ID of a read is the row of its file + 1, the internal ID of a file is 0.
+
+        Args:
+            row (int): Row of the item.
+            column (int): Column of the item.
+            parent (QModelIndex, optional): Index of the parent item. Defaults to the root.
+
+        Returns:
+            QModelIndex: The index of the item or an invalid index if it does not exist.
+        """
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex: # type: ignore overrides QObject.parent as in the Qt tree model examples
+        """
+        Returns the index of the parent of the given index.
+
+        Args:
+            index (QModelIndex): Index of the child item.
+
+        Returns:
+            QModelIndex: Index of the file for reads, an invalid index for files.
+        """
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def hasChildren(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> bool:
+        """
+        Returns whether the given parent has children, including the ones that were not
+        fetched yet. This way collapsed files show the expand indicator.
+
+        Args:
+            parent (QModelIndex, optional): Index of the parent item. Defaults to the root.
+
+        Returns:
+            bool: True for the root if files are loaded and for files with shown reads.
+        """
+        if not parent.isValid():
+            return len(self.files) > 0
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self.shown_read_ids[self.files[parent.row()]]) > 0
+        return False
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Returns the number of children of the given parent. For files this is the number of
+        read IDs fetched so far.
+
+        Args:
+            parent (QModelIndex, optional): Index of the parent item. Defaults to the root.
+
+        Returns:
+            int: Number of child rows.
+        """
+        if not parent.isValid():
+            return len(self.files)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self.fetched[self.files[parent.row()]]
+        return 0
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> bool:
+        """
+        Returns whether the given file has shown read IDs that were not fetched yet.
+
+        Args:
+            parent (QModelIndex): Index of the parent item.
+
+        Returns:
+            bool: True if more read IDs can be fetched.
+        """
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+        path = self.files[parent.row()]
+        return self.fetched[path] < len(self.shown_read_ids[path])
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> None:
+        """
+        Hands all remaining shown read IDs of a file to the view.
+
+        Args:
+            parent (QModelIndex): Index of the file.
+        """
+        if not self.canFetchMore(parent):
+            return
+        path = self.files[parent.row()]
+        start = self.fetched[path]
+        end = len(self.shown_read_ids[path])
+        self.beginInsertRows(parent, start, end - 1)
+        self.fetched[path] = end
+        self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Returns the number of columns (a single one with the path or read ID).
+        """
+        return 1
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Returns the data for a given index.
+
+        Args:
+            index (QModelIndex): The index of the item.
+            role (int, optional): The role to determine how data should be displayed. Defaults to Qt.DisplayRole.
+
+        Returns:
+            str | None: The path or read ID, the path as tooltip of files, None otherwise.
+        """
+        if not index.isValid():
+            return None
+        path, read_id = self.get_path_and_read_id(index)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return path if read_id is None else read_id
+        if role == Qt.ItemDataRole.ToolTipRole and read_id is None:
+            return path
+        return None
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        """
+        Returns the item flags. Items can be selected, but not edited.
+        """
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
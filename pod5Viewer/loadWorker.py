@@ -0,0 +1,121 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+from typing import List, Dict, Any
+import pathlib
+
+try:
+    from pod5Viewer.dataHandler import DataHandler
+except ModuleNotFoundError:
+    from dataHandler import DataHandler
+
+
+class LoadSignals(QObject):
+    """
+    Signals emitted by a LoadRunnable. QRunnable is not a QObject, so the signals are kept in
+    a separate object. The object lives in the GUI thread, so the connected slots are called
+    there as well.
+
+    Attributes:
+        loaded (Signal(DataHandler, Dict[str, List[str]])): Emitted with the DataHandler of the
+            opened files and the read IDs of each file once loading is done.
+        failed (Signal(str)): Emitted with the error message if the files could not be opened.
+    """
+    loaded = Signal(object, object)
+    failed = Signal(str)
+
+
+class LoadRunnable(QRunnable):
+    """
+    Opens POD5 files and reads their read IDs in a thread of a QThreadPool, so opening large
+    files does not block the event loop.
+
+    Attributes:
+        pod5_paths (List[pathlib.Path]): Paths to the POD5 files.
+        signals (LoadSignals): Signals used to report the result.
+    """
+    pod5_paths: List[pathlib.Path]
+    signals: LoadSignals
+
+    def __init__(self, pod5_paths: List[pathlib.Path], signals: LoadSignals) -> None:
+        """
+        Initializes the runnable.
+
+        Args:
+            pod5_paths (List[pathlib.Path]): Paths to the POD5 files.
+            signals (LoadSignals): Signals used to report the result.
+        """
+        super().__init__()
+        self.pod5_paths = pod5_paths
+        self.signals = signals
+
+    def run(self) -> None:
+        """
+        Creates the DataHandler and collects the read IDs of each file. Emits loaded on success
+        and failed if the files cannot be opened.
+        """
+        try:
+            data_handler = DataHandler(self.pod5_paths)
+            id_path_dict = data_handler.ids_to_path()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(data_handler, id_path_dict)
+
+
+class ReadLoadSignals(QObject):
+    """
+    Signals emitted by a ReadLoadRunnable. Each signal carries the generation the load was 
+    started with, so the receiver can discard results of loads that were superseded in the 
+    meantime.
+
+    Attributes:
+        loaded (Signal(int, str, Dict[str, Any])): Emitted with the generation, the read ID and
+            the data of the read once it is loaded.
+        failed (Signal(int, str, str)): Emitted with the generation, the read ID and the error 
+            message if the read could not be loaded.
+    """
+    loaded = Signal(int, str, object)
+    failed = Signal(int, str, str)
+
+
+class ReadLoadRunnable(QRunnable):
+    """
+    Loads the data of a single read in a thread of a QThreadPool, so reads with large signals 
+    can be selected without blocking the event loop.
+
+    Attributes:
+        data_handler (DataHandler): DataHandler of the opened files.
+        read_id (str): ID of the read to load.
+        generation (int): Generation the load was started with. Passed back with the result.
+        signals (ReadLoadSignals): Signals used to report the result.
+    """
+    data_handler: DataHandler
+    read_id: str
+    generation: int
+    signals: ReadLoadSignals
+
+    def __init__(self, data_handler: DataHandler, read_id: str, generation: int, signals: ReadLoadSignals) -> None:
+        """
+        Initializes the runnable.
+
+        Args:
+            data_handler (DataHandler): DataHandler of the opened files.
+            read_id (str): ID of the read to load.
+            generation (int): Generation the load was started with.
+            signals (ReadLoadSignals): Signals used to report the result.
+        """
+        super().__init__()
+        self.data_handler = data_handler
+        self.read_id = read_id
+        self.generation = generation
+        self.signals = signals
+
+    def run(self) -> None:
+        """
+        Loads the read data. Emits loaded on success and failed if the read cannot be loaded.
+        """
+        try:
+            read_data: Dict[str, Any] = self.data_handler.load_read_data(self.read_id)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, self.read_id, str(e))
+            return
+        self.signals.loaded.emit(self.generation, self.read_id, read_data)
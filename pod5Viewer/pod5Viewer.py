@@ -1,31 +1,50 @@
 from PySide6.QtWidgets import (QApplication, QMainWindow, QTreeView, 
-                               QHBoxLayout, QWidget, QTreeWidgetItem, 
-                               QFileDialog, QMessageBox, QTabWidget)
-from PySide6.QtGui import (QStandardItemModel, QStandardItem, QKeySequence, 
+                               QHBoxLayout, QWidget, 
+                               QFileDialog, QMessageBox, QTabWidget, QProgressDialog)
+from PySide6.QtGui import (QKeySequence, 
                            QShortcut, QIcon, QCloseEvent)
-import sys, os, pathlib, json, platform, uuid
+from PySide6.QtCore import Qt, QTimer, QThreadPool
+from functools import partial
+import sys, os, pathlib, json, platform, uuid, math
 from datetime import datetime, date
-from typing import Dict, List, Any, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple, Iterable
 import numpy as np
 
+# optional dependency: orjson is considerably faster than the json module when exporting reads
 try:
-    from pod5Viewer.constants.pod5Viewer_constants import (HELP_STRINGS, WINDOW_TITLE,
-                                                           WINDOW_GEOMETRY, SHORTCUT_HELP_TEXT)
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    from pod5Viewer.constants.pod5Viewer_constants import (WINDOW_TITLE,
+                                                           WINDOW_GEOMETRY, SHORTCUT_HELP_TEXT,
+                                                           PREVIEW_DELAY_MS, EXPORT_TXT_CHUNK_SIZE,
+                                                           PREVIEW_NUM_VALUES, TAB_CACHE_SIZE)
     from pod5Viewer.__version__ import __version__
     from pod5Viewer.dataHandler import DataHandler
+    from pod5Viewer.dataTreeModel import DataTreeModel
     from pod5Viewer.viewWindow import ArrayTableViewer
     from pod5Viewer.fileNavigator import FileNavigator
     from pod5Viewer.figureWindow import FigureWindow
     from pod5Viewer.idInputWindow import IDInputWindow
+    from pod5Viewer.exportWorker import ExportRunnable, ExportSignals
+    from pod5Viewer.loadWorker import LoadRunnable, LoadSignals, ReadLoadRunnable, ReadLoadSignals
 except ModuleNotFoundError:
-    from constants.pod5Viewer_constants import (HELP_STRINGS, WINDOW_TITLE,
-                                                WINDOW_GEOMETRY, SHORTCUT_HELP_TEXT)
+    from constants.pod5Viewer_constants import (WINDOW_TITLE,
+                                                WINDOW_GEOMETRY, SHORTCUT_HELP_TEXT,
+                                                PREVIEW_DELAY_MS, EXPORT_TXT_CHUNK_SIZE,
+                                                PREVIEW_NUM_VALUES, TAB_CACHE_SIZE)
     from __version__ import __version__
     from dataHandler import DataHandler
+    from dataTreeModel import DataTreeModel
     from viewWindow import ArrayTableViewer
     from fileNavigator import FileNavigator
     from figureWindow import FigureWindow
     from idInputWindow import IDInputWindow
+    from exportWorker import ExportRunnable, ExportSignals
+    from loadWorker import LoadRunnable, LoadSignals, ReadLoadRunnable, ReadLoadSignals
 
 # needed to work on Linux Mint...
 if platform.system() == 'Linux':
@@ -34,6 +53,28 @@ if platform.system() == 'Linux':
         if 'Linux Mint' in release_info:
             os.environ['QT_QUICK_BACKEND'] = 'software'
 
+# types that transform_data keeps as they are (looked up via type(value) before any isinstance checks)
+JSON_NATIVE_TYPES = {int, float, str, bool, type(None)}
+# converters used by transform_data for types that cannot be handled by JSON directly
+JSON_CONVERTERS = {uuid.UUID: str, datetime: datetime.isoformat, date: date.isoformat}
+
+
+class NumpyJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder that converts numpy arrays and scalars while encoding. This way the (potentially 
+    very long) signal arrays are only converted to lists one at a time during the export instead 
+    of being stored as lists beforehand. NaN and infinite values in float arrays are written as 
+    null, like orjson does.
+    """
+    def default(self, o: Any) -> Any:
+        if isinstance(o, np.ndarray):
+            if o.dtype.kind == "f" and not np.isfinite(o).all():
+                return [x if math.isfinite(x) else None for x in o.tolist()]
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
+        return super().default(o)
+
 
 class Pod5Viewer(QMainWindow):
     """
@@ -51,27 +92,61 @@ class Pod5Viewer(QMainWindow):
         opened_read_data (Dict[str, np.ndarray]): This dictionary stores the data of all currently opened reads.
             The keys are read IDs, and the values are the corresponding read data. Important for quick access 
             to read data without reloading from files.
+        transformed_data_cache (Dict[str, Dict[str, Any]]): Stores the shortened output of transform_data that is
+            shown in the data viewer for each read ID, so reopening a read does not transform it again. Exports
+            are not cached, as they contain the full signals.
+        active_read_data (Dict[str, Any] | None): Data of the read shown in the current tab. Updated whenever the
+            current tab changes. None if no tab is opened.
         preview_tab (QTreeView | None): This represents the current preview tab in the data_tab_viewer. It shows 
             a quick view of a selected read without fully opening it. Enhances user experience by providing quick
             data previews.
+        proper_tabs (Dict[str, QTreeView]): Maps the read IDs of all opened (non-preview) tabs to their widgets.
+            Allows checking if a read is already opened without iterating over all tabs.
+        tab_cache (OrderedDict[str, Tuple[QTreeView, Dict[str, Any]]]): Stores the tab widget and data of the 
+            most recently prepared reads (at most TAB_CACHE_SIZE), so selecting a read again does not load it 
+            from the file and build its view again. Ordered from least to most recently used.
         plot_window (FigureWindow | None): This keeps track of the currently opened plot window. It's used for 
             displaying graphical representations of read data. Critical for data visualization functionality.
             None until the window is first called.
         reads_of_interest (List[str] | None): List of read IDs given for filtering loaded data. If loaded, only
             reads with fitting IDs get shown in the file navigator. None if no filtering is active. 
+        preview_timer (QTimer): Single-shot timer that delays the preview of the selected read. Restarted on every
+            selection change, so quickly stepping through reads (e.g. holding an arrow key) only loads the read
+            that is selected last.
+        preview_generation (int): Counter that is increased whenever a pending preview becomes obsolete (new
+            selection, opened tab, newly loaded files, cleared viewer). Preview reads are loaded in the background 
+            and only shown if the counter did not change in the meantime.
+        read_load_signals (ReadLoadSignals): Signals of the ReadLoadRunnable objects that load previewed reads.
+        read_load_pool (QThreadPool): Thread pool with a single thread that runs the ReadLoadRunnable objects. 
+            Reads are loaded one after another, and loads that are still queued when their preview becomes 
+            obsolete are dropped before they start.
     """
     file_navigator: FileNavigator
     data_tab_viewer: QTabWidget
     data_handler: DataHandler
     opened_read_data: Dict[str, Any]
+    transformed_data_cache: Dict[str, Dict[str, Any]]
+    active_read_data: Dict[str, Any] | None
     preview_tab: QTreeView | None
+    proper_tabs: Dict[str, QTreeView]
+    tab_cache: OrderedDict[str, Tuple[QTreeView, Dict[str, Any]]]
     plot_window: FigureWindow | None
     reads_of_interest: List[str] | None
+    preview_timer: QTimer
+    preview_generation: int
+    read_load_signals: ReadLoadSignals
+    read_load_pool: QThreadPool
+
+    __resource_base_path: str | None = None
+    __app_icon: QIcon | None = None
 
     def __init__(self, file_paths: List[str]|None = None) -> None:
         """
         Initializes the Pod5Viewer application. Initializes UI, attributes, shortcuts, 
-        and loads files if provided.
+        and loads files if provided. Shortcuts and files are set up by zero-delay timers,
+        i.e. once the event loop is running, instead of within the constructor. This does
+        not guarantee that the window was painted before; the files themselves are loaded
+        in the background (see load_files).
         
         Args:
             file_paths (List[str] | None): Optional list of file paths to be loaded at startup.
@@ -79,10 +154,10 @@ class Pod5Viewer(QMainWindow):
         super().__init__()
         self.init_ui()
         self.init_attrs()
-        self.init_shortcuts()
+        QTimer.singleShot(0, self.init_shortcuts)
 
         if file_paths:
-            self.load_files(file_paths)
+            QTimer.singleShot(0, lambda: self.load_files(file_paths))
 
     def init_ui(self) -> None:
         """
@@ -92,7 +167,7 @@ class Pod5Viewer(QMainWindow):
         """
         self.setWindowTitle(WINDOW_TITLE)
         self.setGeometry(*WINDOW_GEOMETRY)
-        self.icon = QIcon(self.__resource_path("icon.ico"))
+        self.icon = self.__get_app_icon()
         self.setWindowIcon(self.icon)
 
         self.init_menu()
@@ -106,9 +181,6 @@ class Pod5Viewer(QMainWindow):
         """
         Initializes the menu and connects actions to corresponding methods.
         """
-        # set up the dropdown menu in the top
-        menubar = self.menuBar()
-
         # set up the dropdown menu in the top
         menubar = self.menuBar()
         menubar.setNativeMenuBar(False) # activate menu bar on MacOS
@@ -130,11 +202,13 @@ class Pod5Viewer(QMainWindow):
         export_signal_nonpa_menu.addAction("Current read (.npy/.txt)...", lambda: self.export_focussed_signal(in_pa=False))
         export_signal_nonpa_menu.addAction("All opened reads (.npy)...", lambda: self.export_opened_signals(in_pa=False, suffix=".npy"))
         export_signal_nonpa_menu.addAction("All opened reads (.txt)...", lambda: self.export_opened_signals(in_pa=False, suffix=".txt"))
+        export_signal_nonpa_menu.addAction("All opened reads as archive (.npz)...", lambda: self.export_opened_signals_archive(in_pa=False))
 
         export_signal_pa_menu = export_signal_menu.addMenu("pA signal")
         export_signal_pa_menu.addAction("Current read (.npy/.txt)...", lambda: self.export_focussed_signal(in_pa=True))
         export_signal_pa_menu.addAction("All opened reads (.npy)...", lambda: self.export_opened_signals(in_pa=True, suffix=".npy"))
         export_signal_pa_menu.addAction("All opened reads (.txt)...", lambda: self.export_opened_signals(in_pa=True, suffix=".txt"))
+        export_signal_pa_menu.addAction("All opened reads as archive (.npz)...", lambda: self.export_opened_signals_archive(in_pa=True))
 
         main_menu.addSeparator()
 
@@ -184,8 +258,8 @@ class Pod5Viewer(QMainWindow):
         """
         self.file_navigator = FileNavigator()
         self.file_navigator.itemSelectionChanged.connect(self.on_tree_selection_changed)
-        self.file_navigator.itemDoubleClicked.connect(self.add_proper_tab)
-        self.file_navigator.itemActivated.connect(self.add_proper_tab)
+        self.file_navigator.readDoubleClicked.connect(self.add_proper_tab)
+        self.file_navigator.readActivated.connect(self.add_proper_tab)
 
     def init_data_tab_viewer(self) -> None:
         """
@@ -194,6 +268,7 @@ class Pod5Viewer(QMainWindow):
         self.data_tab_viewer = QTabWidget()
         self.data_tab_viewer.setTabsClosable(True)
         self.data_tab_viewer.tabCloseRequested.connect(self.remove_tab)
+        self.data_tab_viewer.currentChanged.connect(self.update_active_read_data)
 
     def init_layout(self) -> None:
         """
@@ -213,27 +288,56 @@ class Pod5Viewer(QMainWindow):
         """
         Initializes attributes. Directly after initialization:
         - no filtering
-        - no preview tab
+        - no preview tab and no proper tabs
         - no data view window opened
         - no plot window opened
         - no reads opened (empty Dict)
+        - no pending preview (generation 0)
         """
         self.reads_of_interest = None
         self.preview_tab = None
+        self.proper_tabs = {}
+        self.tab_cache = OrderedDict()
         self.data_view_window = None
         self.plot_window = None
         self.opened_read_data = {}
+        self.transformed_data_cache = {}
+        self.active_read_data = None
+
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self.preview_selected_item)
+
+        self.preview_generation = 0
+        self.read_load_signals = ReadLoadSignals(self)
+        self.read_load_signals.loaded.connect(self.preview_read_loaded)
+        self.read_load_signals.failed.connect(self.preview_read_failed)
+        self.read_load_pool = QThreadPool(self)
+        self.read_load_pool.setMaxThreadCount(1)
 
     def __resource_path(self, relative_path: str) -> str:
         """
-        Get the absolute path to a resource, works for dev and for PyInstaller
+        Get the absolute path to a resource, works for dev and for PyInstaller.
+        The base path does not change while the application runs, so it is only 
+        determined on the first call.
         """
-        if hasattr(sys, "_MEIPASS"):
-            # When running in a PyInstaller bundle, the _MEIPASS attribute is set.
-            base_path = getattr(sys, "_MEIPASS")
-        else:
-            base_path = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
-        return os.path.join(base_path, relative_path)
+        if Pod5Viewer.__resource_base_path is None:
+            if hasattr(sys, "_MEIPASS"):
+                # When running in a PyInstaller bundle, the _MEIPASS attribute is set.
+                Pod5Viewer.__resource_base_path = getattr(sys, "_MEIPASS")
+            else:
+                Pod5Viewer.__resource_base_path = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+        return os.path.join(Pod5Viewer.__resource_base_path, relative_path)
+
+    def __get_app_icon(self) -> QIcon:
+        """
+        Returns the application icon. The icon file is only loaded on the first call,
+        afterwards the same QIcon is shared by all windows.
+        """
+        if Pod5Viewer.__app_icon is None:
+            Pod5Viewer.__app_icon = QIcon(self.__resource_path("icon.ico"))
+        return Pod5Viewer.__app_icon
 
     def init_shortcuts(self) -> None:
         """
@@ -370,37 +474,70 @@ class Pod5Viewer(QMainWindow):
 
         if dialog.exec():
             pod5_dir = dialog.selectedFiles()[0]
-            files_in_dir = [os.path.join(pod5_dir, file) for file in os.listdir(pod5_dir)]
-            files_in_dir = [file for file in files_in_dir if os.path.isfile(file)]
-            if len(files_in_dir) > 0:
-                pod5_files = [file for file in files_in_dir if file.split(".")[1]=="pod5"]
-                if len(pod5_files) > 0:
-                    self.load_files(pod5_files)
+            # scandir entries cache the file type, so no extra stat call is needed per file
+            with os.scandir(pod5_dir) as entries:
+                pod5_files = [entry.path for entry in entries if entry.name.lower().endswith(".pod5") and entry.is_file()]
+            if len(pod5_files) > 0:
+                self.load_files(pod5_files)
 
 
-    def load_files(self, file_paths: List[str]) -> None:
+    def load_files(self, file_paths: Iterable[str | pathlib.Path]) -> None:
         """
-        Loads the specified POD5 files using the DataHandler.
-        Updates the file navigator with read IDs from loaded files.
+        Loads the specified POD5 files using the DataHandler. The files are opened by a 
+        LoadRunnable in the global QThreadPool while a modal progress dialog is shown. 
+        Once done, files_loaded updates the file navigator with the read IDs.
 
         Args:
-            file_paths (List[str]): A list of file paths to POD5 files to be loaded.
+            file_paths (Iterable[str | pathlib.Path]): Paths to POD5 files to be loaded.
+        """
+        # joins relative paths with the current directory to get absolute paths (absolute paths stay
+        # as they are); avoids issues where the relative paths are searched in /tmp on linux systems
+        current_dir = pathlib.Path.cwd()
+        paths_as_path = [current_dir / path for path in file_paths]
+
+        progress = QProgressDialog("Loading files...", "", 0, 0, self)
+        progress.setWindowTitle("Loading")
+        progress.setCancelButton(None) # type: ignore removes the button as described in the Qt docs
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+
+        signals = LoadSignals(progress)
+        signals.loaded.connect(self.files_loaded)
+        signals.failed.connect(self.files_load_failed)
+        # the dialog is deleted when loading is done (also deletes the signals object)
+        signals.loaded.connect(progress.deleteLater)
+        signals.failed.connect(progress.deleteLater)
+
+        QThreadPool.globalInstance().start(LoadRunnable(paths_as_path, signals))
+
+    def files_loaded(self, data_handler: DataHandler, file_navigator_data: Dict[str, List[str]]) -> None:
         """
-        current_dir = os.getcwd()
-        file_paths_processed = []
-        for path in file_paths:
-            # joins a relative path with the current directory to get an absolute path
-            # avoids issues where the relative paths are searched in /tmp on linux systems
-            if not os.path.isabs(path):
-                path = os.path.join(current_dir, path) 
-            file_paths_processed.append(path)
+        Takes over the DataHandler of newly loaded files and shows their read IDs in the 
+        file navigator. Called once the LoadRunnable started in load_files is done.
 
-        paths_as_path = [pathlib.Path(i) for i in file_paths_processed]
-        self.data_handler = DataHandler(paths_as_path)
-        file_navigator_data = self.data_handler.ids_to_path()
+        Args:
+            data_handler (DataHandler): DataHandler of the loaded files.
+            file_navigator_data (Dict[str, List[str]]): Read IDs of each loaded file.
+        """
+        # reads of the previous files that are still loading must not be shown
+        self.preview_generation += 1
+        self.read_load_pool.clear()
+        self.data_handler = data_handler
+        self.transformed_data_cache = {}
+        self.clear_tab_cache()
 
         self.file_navigator.load_data(file_navigator_data)
 
+    def files_load_failed(self, message: str) -> None:
+        """
+        Shows an error message if the files could not be loaded.
+
+        Args:
+            message (str): The error message.
+        """
+        QMessageBox.critical(self, "Loading failed", f"The selected file(s) could not be opened: {message}")
+
     def open_id_input_window(self) -> None:
         """
         Opens the IDInputWindow window for read filtering. If no data was loaded it shows 
@@ -426,129 +563,255 @@ class Pod5Viewer(QMainWindow):
         """
         Callback method triggered when the selection in the tree view changes.
 
-        This method updates the preview tab with the selected item.
+        (Re)starts the preview timer instead of updating the preview tab directly. This way
+        a burst of selection changes only results in a single preview of the final selection.
 
         Returns:
             None
         """
-        selected_items = self.file_navigator.selectedItems()
-        if selected_items:
-            item = selected_items[0]
-            self.update_preview_tab(item)
+        self.preview_timer.start()
 
-    def update_preview_tab(self, item: QTreeWidgetItem):
+    def preview_selected_item(self) -> None:
+        """
+        Updates the preview tab with the currently selected item. Called once the preview
+        timer runs out.
         """
-        Updates the preview tab with data corresponding to the selected item.
-        Creates or updates a tab in the data_tab_viewer for quick preview.
+        read_id = self.file_navigator.selected_read_id()
+        if read_id is not None:
+            self.update_preview_tab(read_id)
+
+    def update_preview_tab(self, read_id: str) -> None:
+        """
+        Updates the preview tab with data corresponding to the selected read.
+        Reads in the tab_cache are shown directly. All other reads are loaded by a
+        ReadLoadRunnable in the read_load_pool and shown once loading is done, 
+        so the event loop is not blocked by large reads. Loads of previously selected 
+        reads that did not start yet are dropped.
         
         Args:
-            item (QTreeWidgetItem): The selected item in the tree widget.        
+            read_id (str): The ID of the selected read.
         """
-        if item.childCount() == 0:
-            read_id = item.text(0)
+        self.preview_generation += 1
+        self.read_load_pool.clear()
 
-            if self.preview_tab:
-                self.data_tab_viewer.removeTab(self.data_tab_viewer.indexOf(self.preview_tab))
-            
-            self.preview_tab, preview_data = self.prepare_tab_data(read_id)
-            self.opened_read_data[read_id] = preview_data
+        if read_id in self.tab_cache:
+            self.show_preview_tab(read_id)
+        else:
+            self.read_load_pool.start(
+                ReadLoadRunnable(self.data_handler, read_id, self.preview_generation, self.read_load_signals))
 
-            self.data_tab_viewer.addTab(self.preview_tab, read_id)
-            self.data_tab_viewer.setCurrentWidget(self.preview_tab)
+    def preview_read_loaded(self, generation: int, read_id: str, read_data: Dict[str, Any]) -> None:
+        """
+        Shows a read loaded in the background in the preview tab. Called once a ReadLoadRunnable
+        started in update_preview_tab is done. Results of outdated loads are discarded.
 
+        Args:
+            generation (int): The preview_generation the load was started with.
+            read_id (str): The ID of the loaded read.
+            read_data (Dict[str, Any]): The data of the loaded read.
+        """
+        if generation == self.preview_generation:
+            self.show_preview_tab(read_id, read_data)
 
-    def add_proper_tab(self, item):
+    def preview_read_failed(self, generation: int, read_id: str, message: str) -> None:
         """
-        Adds a full data tab to the data tab viewer for the selected item.
-        If a tab for the item already exists, it's selected instead of creating a new one.
+        Shows an error message if the read to preview could not be loaded. Errors of outdated 
+        loads are discarded.
 
         Args:
-            item: The item to be added as a tab.
+            generation (int): The preview_generation the load was started with.
+            read_id (str): The ID of the read.
+            message (str): The error message.
         """
-        # If the item has no child items, it is added as a proper tab to the data tab viewer.
-        if item.childCount() == 0:
-            read_id = item.text(0)
+        if generation == self.preview_generation:
+            QMessageBox.critical(self, "Loading failed", f"Read {read_id} could not be loaded: {message}")
 
-            if self.preview_tab:
-                self.data_tab_viewer.removeTab(self.data_tab_viewer.indexOf(self.preview_tab))
-                # After adding a proper tab, the next selection should be a preview tab.
-                self.preview_tab = None
+    def show_preview_tab(self, read_id: str, read_data: Dict[str, Any] | None = None) -> None:
+        """
+        Creates or updates a tab in the data_tab_viewer for quick preview of the given read.
 
-            for i in range(self.data_tab_viewer.count()):
-                # If a tab with the same item_id already exists, it is selected instead of adding a new tab.
-                if self.data_tab_viewer.tabText(i) == read_id:
-                    self.data_tab_viewer.setCurrentIndex(i)
-                    return
+        Args:
+            read_id (str): The ID of the read.
+            read_data (Dict[str, Any] | None): The already loaded data of the read. If None, the 
+                data is taken from the tab_cache or loaded from the file.
+        """
+        if self.preview_tab:
+            preview_index = self.data_tab_viewer.indexOf(self.preview_tab)
+            preview_read_id = self.data_tab_viewer.tabText(preview_index)
+            self.data_tab_viewer.removeTab(preview_index)
+            self.discard_tab_widget(self.preview_tab)
+            # the data of the read previewed again is kept
+            if preview_read_id != read_id:
+                self.release_read_data(preview_read_id)
+        
+        self.preview_tab, preview_data = self.prepare_tab_data(read_id, read_data)
+        self.opened_read_data[read_id] = preview_data
+
+        self.data_tab_viewer.addTab(self.preview_tab, read_id)
+        self.data_tab_viewer.setCurrentWidget(self.preview_tab)
+
+
+    def add_proper_tab(self, read_id: str) -> None:
+        """
+        Adds a full data tab to the data tab viewer for the given read.
+        If a tab for the read already exists, it's selected instead of creating a new one.
+
+        Args:
+            read_id (str): The ID of the read to be added as a tab.
+        """
+        # a pending preview would otherwise open the same read again once the timer runs out
+        # or its background load is done
+        self.preview_timer.stop()
+        self.preview_generation += 1
+        self.read_load_pool.clear()
+
+        if self.preview_tab:
+            preview_index = self.data_tab_viewer.indexOf(self.preview_tab)
+            preview_read_id = self.data_tab_viewer.tabText(preview_index)
+            self.data_tab_viewer.removeTab(preview_index)
+            self.discard_tab_widget(self.preview_tab)
+            # After adding a proper tab, the next selection should be a preview tab.
+            self.preview_tab = None
+            if preview_read_id != read_id:
+                self.release_read_data(preview_read_id)
+
+        # If a tab with the same item_id already exists, it is selected instead of adding a new tab.
+        if read_id in self.proper_tabs:
+            self.data_tab_viewer.setCurrentWidget(self.proper_tabs[read_id])
+            return
 
-            # The opened read data is stored in the opened_read_data dictionary.
-            proper_tab, proper_tab_data = self.prepare_tab_data(read_id)
-            self.opened_read_data[read_id] = proper_tab_data
+        # The opened read data is stored in the opened_read_data dictionary.
+        proper_tab, proper_tab_data = self.prepare_tab_data(read_id)
+        self.opened_read_data[read_id] = proper_tab_data
+        self.proper_tabs[read_id] = proper_tab
 
-            self.data_tab_viewer.addTab(proper_tab, read_id)
-            self.data_tab_viewer.setCurrentWidget(proper_tab)
+        self.data_tab_viewer.addTab(proper_tab, read_id)
+        self.data_tab_viewer.setCurrentWidget(proper_tab)
 
 
-    def prepare_tab_data(self, read_id: str) -> Tuple[QTreeView, Dict[str, Any]]:
+    def prepare_tab_data(self, read_id: str, read_data: Dict[str, Any] | None = None) -> Tuple[QTreeView, Dict[str, Any]]:
         """
         Prepares the data for a tab in the pod5Viewer application.
-        Creates a QTreeView with the read data and sets up tooltips using HELP_STRINGS.
+        Creates a QTreeView showing the read data through a DataTreeModel (which also 
+        provides the tooltips from HELP_STRINGS). Reuses the widget and data from the 
+        tab_cache if the read was prepared recently. If the cached widget is shown in a tab, 
+        only the data is reused.
 
         Args:
             read_id (str): The ID of the read data.
+            read_data (Dict[str, Any] | None): The already loaded data of the read. If None, the 
+                data is loaded from the file unless it is cached.
 
         Returns: 
             Tuple[QTreeView, Dict[str, Any]]: A tuple containing the QTreeView widget and the loaded data.
         """
+        cached_tab = self.tab_cache.get(read_id)
+        if cached_tab is not None and self.data_tab_viewer.indexOf(cached_tab[0]) == -1:
+            self.tab_cache.move_to_end(read_id)
+            return cached_tab
+
         data_viewer = QTreeView()
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels(['Key', 'Value'])
 
-        data_viewer_data = self.data_handler.load_read_data(read_id)
-        self.populate_tree_model(model.invisibleRootItem(), self.transform_data(data_viewer_data))
+        if cached_tab is not None:
+            # the cached widget is shown in another tab, but its data can still be used
+            data_viewer_data = cached_tab[1]
+        elif read_data is not None:
+            data_viewer_data = read_data
+        else:
+            data_viewer_data = self.data_handler.load_read_data(read_id)
+        model = DataTreeModel(self.get_transformed_data(read_id, self.preview_data(data_viewer_data)), data_viewer)
 
         data_viewer.setModel(model)
         data_viewer.setColumnWidth(0, 230)
+        # all rows contain a single line of text, so the view does not need to measure each row
+        data_viewer.setUniformRowHeights(True)
 
+        self.cache_tab(read_id, data_viewer, data_viewer_data)
         return data_viewer, data_viewer_data
 
 
-    def populate_tree_model(self, parent: QStandardItem, data: Dict[str, Any], parent_keys: List[str] = []) -> None:
+    def cache_tab(self, read_id: str, data_viewer: QTreeView, data: Dict[str, Any]) -> None:
         """
-        Recursively populates the data viewer with hierarchical data.
+        Adds a prepared tab to the tab_cache. If the cache is full, the least recently used 
+        entry is dropped and its widget deleted, unless it is shown in a tab.
 
         Args:
-            parent (QStandardItem): The parent item in the data viewer.
-            data (Dict[str, Any]): The data to be displayed, structured as a dictionary.
-            parent_keys (List[str]): The list of parent keys leading to the current data.
+            read_id (str): The ID of the read.
+            data_viewer (QTreeView): The tab widget showing the read.
+            data (Dict[str, Any]): The data of the read.
         """
-        for key, value in data.items():
-            help_str = HELP_STRINGS.get(" ".join(parent_keys + [key]), None)
-            if not help_str:
-                help_str = "No docstring available"
+        self.tab_cache[read_id] = (data_viewer, data)
+        self.tab_cache.move_to_end(read_id)
+        while len(self.tab_cache) > TAB_CACHE_SIZE:
+            _, (cached_viewer, _) = self.tab_cache.popitem(last=False)
+            if self.data_tab_viewer.indexOf(cached_viewer) == -1:
+                cached_viewer.deleteLater()
 
-            if isinstance(value, dict):
-                item = QStandardItem(key)
-                item.setEditable(False)
-                item.setToolTip(help_str)
-                parent.appendRow(item)
-                # if statement to catch the individual signal_rows entries (need 'signal_rows <key>' without number)
-                self.populate_tree_model(item, value, parent_keys if key.isdigit() else parent_keys + [key])
-            else:
-                key_item = QStandardItem(key)
-                key_item.setEditable(False)
-                key_item.setToolTip(help_str)
 
-                if type(value) == np.ndarray:
-                    value_item = QStandardItem(", ".join([str(i) for i in value]))
-                else:
-                    value_item = QStandardItem(str(value))
+    def discard_tab_widget(self, tab_widget: QWidget) -> None:
+        """
+        Deletes the widget of a removed tab. QTabWidget.removeTab does not delete the widget, so 
+        it (and its model) would otherwise be kept alive by the tab widget. Widgets that are in the 
+        tab_cache are kept for reuse.
+
+        Args:
+            tab_widget (QWidget): Widget that was removed from the data_tab_viewer.
+        """
+        if not any(tab_widget is cached_viewer for cached_viewer, _ in self.tab_cache.values()):
+            tab_widget.deleteLater()
+
+
+    def clear_tab_cache(self) -> None:
+        """
+        Removes all entries from the tab_cache and deletes the widgets that are not shown in a tab.
+        """
+        for cached_viewer, _ in self.tab_cache.values():
+            if self.data_tab_viewer.indexOf(cached_viewer) == -1:
+                cached_viewer.deleteLater()
+        self.tab_cache.clear()
+
+
+    def update_active_read_data(self, index: int) -> None:
+        """
+        Stores a reference to the data of the read in the current tab, so actions on the 
+        focussed read do not need to look it up.
+
+        Args:
+            index (int): Index of the current tab. -1 if no tab is opened.
+        """
+        if index == -1:
+            self.active_read_data = None
+        else:
+            self.active_read_data = self.opened_read_data.get(self.data_tab_viewer.tabText(index))
+
 
-                parent.appendRow([key_item, value_item])
+    def preview_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns a copy of the read data for showing it in the data viewer. As the pA signal is only 
+        calculated on request, only the part of it that is shown in the data viewer is calculated. 
+        One value more than shown is calculated, so transform_data shortens it the same way as the 
+        full signal.
+
+        Args:
+            data (Dict[str, Any]): Data of a read as returned by DataHandler.load_read_data
+
+        Returns:
+            Dict[str, Any]: Read data with the beginning of the pA signal.
+        """
+        if not isinstance(data.get("signal"), np.ndarray):
+            return data
+        preview = dict(data)
+        try:
+            preview["signal_pa"] = self.data_handler.calibrate_signal(data, data["signal"][:PREVIEW_NUM_VALUES+1])
+        except Exception as e:
+            preview["signal_pa"] = f"ERROR: {e}"
+        return preview
 
 
     def remove_tab(self, index: int) -> None:
         """
-        Removes a tab from the data tab viewer and deletes the corresponding data from the opened_read_data dictionary.
+        Removes a tab from the data tab viewer and deletes the corresponding data from the opened_read_data 
+        dictionary, unless the read is still shown in another tab.
 
         Args:
             index (int): The index of the tab to be removed.
@@ -556,13 +819,35 @@ class Pod5Viewer(QMainWindow):
         Returns:
             None
         """
-        del(self.opened_read_data[self.data_tab_viewer.tabText(index)])
+        read_id = self.data_tab_viewer.tabText(index)
+        tab_widget = self.data_tab_viewer.widget(index)
+        if self.proper_tabs.get(read_id) is tab_widget:
+            self.proper_tabs.pop(read_id)
         self.data_tab_viewer.removeTab(index)
+        self.discard_tab_widget(tab_widget)
+        self.release_read_data(read_id)
 
         if self.preview_tab and self.data_tab_viewer.indexOf(self.preview_tab) == -1:
             self.preview_tab = None
 
 
+    def release_read_data(self, read_id: str) -> None:
+        """
+        Deletes the data of a read from opened_read_data and the caches derived from it, once 
+        the read is not shown in any tab anymore. The data of reads that are still shown in 
+        another tab (e.g. as preview and proper tab) is kept. The tab_cache entry of the read 
+        is kept as well, it is released when cache_tab evicts it.
+
+        Args:
+            read_id (str): The ID of the read whose tab was removed.
+        """
+        for i in range(self.data_tab_viewer.count()):
+            if self.data_tab_viewer.tabText(i) == read_id:
+                return
+        self.opened_read_data.pop(read_id, None)
+        self.transformed_data_cache.pop(read_id, None)
+
+
     def export_focussed_read(self) -> None:
         """
         Export all information of the currently focussed read to a selected path in JSON format.
@@ -626,17 +911,18 @@ class Pod5Viewer(QMainWindow):
     def export_opened_reads(self) -> None:
         """
         Export all information of all opened reads to individual files in the specified 
-        directory.
+        directory. The files are written in the background (see write_json_files).
         """
         if self.data_tab_viewer.count() > 0:
             directory = self.dirpath_dialog()
-            if directory:
+            if directory and self.directory_writable(directory):
+                export_jobs = []
                 for i in range(self.data_tab_viewer.count()):
                     read_id = self.data_tab_viewer.tabText(i)
                     filepath = os.path.join(directory, read_id+"_export.json")
                     if self.resume_with_path(filepath):
-                        success = self.write_json(read_id, filepath)
-                        if not success: break
+                        export_jobs.append((read_id, self.opened_read_data[read_id], filepath))
+                self.write_json_files(export_jobs)
         else:
             self.show_no_data_opened_message()
         
@@ -652,7 +938,7 @@ class Pod5Viewer(QMainWindow):
         """
         if self.data_tab_viewer.count() > 0:
             directory = self.dirpath_dialog()
-            if directory:
+            if directory and self.directory_writable(directory):
                 export_str = "_export_pa" if in_pa else "_export" 
                 for i in range(self.data_tab_viewer.count()):
                     read_id = self.data_tab_viewer.tabText(i)
@@ -678,6 +964,46 @@ class Pod5Viewer(QMainWindow):
         return dirpath
 
 
+    def export_opened_signals_archive(self, in_pa: bool) -> None:
+        """
+        Export the (pA) signal of all opened reads to a single npz archive at a selected path.
+        Each signal is stored under its read ID.
+
+        Args:
+            in_pa (bool): True if the pA signal gets exported
+        """
+        if self.data_tab_viewer.count() > 0:
+            export_str = "_export_pa" if in_pa else "_export" 
+            filepath = self.filepath_dialog(
+                caption = "Export all opened reads",
+                dir = "opened_reads" + export_str + ".npz",
+                filter="Numpy Archives (*.npz);;All Files (*)"
+            )
+            if filepath:
+                read_ids = [self.data_tab_viewer.tabText(i) for i in range(self.data_tab_viewer.count())]
+                self.write_npz(read_ids, filepath, in_pa)
+        else:
+            self.show_no_data_opened_message()
+
+
+    def directory_writable(self, directory: str) -> bool:
+        """
+        Checks once before exporting multiple files if the target directory is writable, 
+        instead of letting each file fail separately. Shows an error message if it is not.
+
+        Args:
+            directory (str): Path to the target directory
+
+        Returns:
+            bool: True if files can be written to the directory
+        """
+        if not os.access(directory, os.W_OK):
+            QMessageBox.critical(self, "Permission error", 
+                                 f"Export failed. You do not have permissions to write to directory {directory}")
+            return False
+        return True
+
+
     def resume_with_path(self, filepath: str) -> bool:
         """
         Check if a file exists at a given path. If so opens a warning message and lets
@@ -716,10 +1042,10 @@ class Pod5Viewer(QMainWindow):
             bool: True, if the write operation was successfull
         """
         if read_id in self.opened_read_data.keys():
-            read_dict = self.transform_data(self.opened_read_data[read_id], shorten=False)
+            json_bytes = self.get_json_bytes(self.opened_read_data[read_id])
             try: 
-                with open(filepath, 'w') as file:
-                    json.dump(read_dict, file, indent=4)
+                with open(filepath, 'wb') as file:
+                    file.write(json_bytes)
             except PermissionError:
                 QMessageBox.critical(self, "Permission error", 
                                         f"Export failed. You do not have permissions to write to path {filepath}")
@@ -727,6 +1053,83 @@ class Pod5Viewer(QMainWindow):
         return True
 
 
+    def write_json_files(self, export_jobs: List[Tuple[str, Dict[str, Any], str]]) -> None:
+        """
+        Writes the information of multiple reads to JSON format. The encoding and writing is done 
+        by ExportRunnable objects in the global QThreadPool, so the window stays responsive while 
+        exporting many (long) reads. A modal progress dialog shows the number of written files. 
+        If files cannot be written, a single error message (with the reason of the first failed 
+        file) is shown once all runnables are done.
+
+        Args:
+            export_jobs (List[Tuple[str, Dict[str, Any], str]]): Read ID, read data and output path of 
+                each read to export. The read data is passed along, so closing a tab during the export 
+                does not affect it.
+        """
+        if len(export_jobs) == 0:
+            return
+
+        progress = QProgressDialog("Exporting reads...", "", 0, len(export_jobs), self)
+        progress.setWindowTitle("Export")
+        progress.setCancelButton(None) # type: ignore removes the button as described in the Qt docs
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+
+        signals = ExportSignals(progress)
+        failed_messages = []
+        num_done = 0
+
+        def file_done() -> None:
+            nonlocal num_done
+            num_done += 1
+            # the dialog closes itself once the maximum is reached
+            progress.setValue(num_done)
+            if num_done == len(export_jobs):
+                if len(failed_messages) > 0:
+                    QMessageBox.critical(self, "Export error", f"Export failed. {failed_messages[0]}")
+                progress.deleteLater()
+
+        def file_failed(filepath: str, message: str) -> None:
+            failed_messages.append(message)
+            file_done()
+
+        signals.written.connect(file_done)
+        signals.failed.connect(file_failed)
+
+        for read_id, read_data, filepath in export_jobs:
+            runnable = ExportRunnable(filepath, partial(self.get_json_bytes, read_data), signals)
+            QThreadPool.globalInstance().start(runnable)
+
+
+    def get_json_bytes(self, read_data: Dict[str, Any]) -> bytes:
+        """
+        Returns the JSON encoded information of an opened read. Uses orjson if it is installed
+        (numpy arrays are serialized natively), otherwise falls back to the json module. Both 
+        produce the same document: indented by 2 spaces, NaN and infinite values as null and 
+        float values at full (float64) precision. If the signal cannot be converted to pA, the 
+        error message is exported in place of the pA signal, so the other information of the 
+        read is still exported.
+        Called by write_json and in the worker threads of write_json_files.
+
+        Args:
+            read_data (Dict[str, Any]): Data of the read
+
+        Returns:
+            bytes: The encoded JSON
+        """
+        try:
+            signal_pa = self.data_handler.get_signal(read_data, in_pa=True)
+        except ValueError as e:
+            signal_pa = f"ERROR: {e}"
+        # the pA signal is not stored in the read data, so it is added to a (shallow) copy for exporting
+        read_data = dict(read_data, signal_pa=signal_pa)
+        read_dict = self.transform_data(read_data, shorten=False, json_export=True)
+        if orjson:
+            return orjson.dumps(read_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(read_dict, indent=2, ensure_ascii=False, cls=NumpyJSONEncoder).encode()
+
+
     def write_numpy(self, read_id: str, filepath: str, in_pa: bool) -> bool:
         """
         Writes the signal of a given read to a numpy npy or txt file.
@@ -741,12 +1144,16 @@ class Pod5Viewer(QMainWindow):
         to_npy = filepath.endswith(".npy")
 
         if read_id in self.opened_read_data.keys():
-            signal = self.opened_read_data[read_id]["signal_pa" if in_pa else "signal"]
+            try:
+                signal = self.data_handler.get_signal(self.opened_read_data[read_id], in_pa)
+            except ValueError as e:
+                self.show_signal_error(read_id, e)
+                return False
             try:
                 if to_npy:
                     np.save(filepath, signal, allow_pickle=False)
                 else:
-                    np.savetxt(filepath, signal)
+                    self.write_text(signal, filepath)
             except PermissionError:
                 QMessageBox.critical(self, "Permission error", 
                                         f"Export failed. You do not have permissions to write to path {filepath}")
@@ -754,7 +1161,72 @@ class Pod5Viewer(QMainWindow):
         return True
 
 
-    def transform_data(self, data: Dict[str, Any], shorten: bool = True) -> Dict[str, Any]:
+    def write_npz(self, read_ids: List[str], filepath: str, in_pa: bool) -> bool:
+        """
+        Writes the signals of multiple reads to a single (uncompressed) numpy npz archive, 
+        using the read IDs as names of the arrays.
+
+        Args:
+            read_ids (List[str]): IDs of the reads to export
+            filepath (str): Path to the output .npz file
+            in_pa (bool): True if the pA signal gets exported
+
+        Returns:
+            bool: True, if the write operation was successfull
+        """
+        signals = {}
+        for read_id in read_ids:
+            if read_id in self.opened_read_data:
+                try:
+                    signals[read_id] = self.data_handler.get_signal(self.opened_read_data[read_id], in_pa)
+                except ValueError as e:
+                    self.show_signal_error(read_id, e)
+                    return False
+        try:
+            np.savez(filepath, **signals)
+        except PermissionError:
+            QMessageBox.critical(self, "Permission error", 
+                                    f"Export failed. You do not have permissions to write to path {filepath}")
+            return False
+        return True
+
+
+    def write_text(self, signal: np.ndarray, filepath: str) -> None:
+        """
+        Writes a signal to a text file with one value per line. The values are converted 
+        to strings chunk-wise in single numpy calls (shortest representation that reads 
+        back to the same value), which is considerably faster than np.savetxt.
+
+        Args:
+            signal (np.ndarray): 1D signal array
+            filepath (str): Path to the output .txt file
+        """
+        with open(filepath, 'w') as file:
+            for start in range(0, len(signal), EXPORT_TXT_CHUNK_SIZE):
+                chunk = signal[start:start+EXPORT_TXT_CHUNK_SIZE]
+                file.write("\n".join(chunk.astype(str).tolist()))
+                file.write("\n")
+
+
+    def get_transformed_data(self, read_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the (shortened) transformed data of a read shown in the data viewer. The result 
+        of transform_data is cached per read ID, as the data of a read does not change after 
+        loading. Only the shortened data is cached, so the cache stays small.
+
+        Args:
+            read_id (str): ID of the read the data belongs to
+            data (Dict[str, Any]): The data to be transformed
+
+        Returns:
+            Dict[str, Any]: The transformed data.
+        """
+        if read_id not in self.transformed_data_cache:
+            self.transformed_data_cache[read_id] = self.transform_data(data, shorten=True)
+        return self.transformed_data_cache[read_id]
+
+
+    def transform_data(self, data: Dict[str, Any], shorten: bool = True, json_export: bool = False) -> Dict[str, Any]:
         """
         Prepares the data to be shown in the data view panel or for exporting. Transforms
         data types to types that can be handled by JSON format.
@@ -762,26 +1234,56 @@ class Pod5Viewer(QMainWindow):
         Args:
             data (Dict[str, Any]): The data to be transformed
             shorten (bool): True when setting up data for exporting 
+            json_export (bool): True when preparing the data for the JSON export. (Unshortened) numpy 
+                arrays are then kept for the encoder instead of being converted to lists, with float 
+                arrays widened to float64. NaN and infinite floats are replaced by None (null).
 
         Returns:
             Dict[str, Any]: The transformed data.
         """
         transformed_data = {}
-        for key, value in data.items():
-            if isinstance(value, np.ndarray):
-                num_values = 100
-                if shorten and (len(value) > num_values):
-                    transformed_data[key] = ",".join(str(x) for x in value[:num_values]) + "..."
+        # nested dictionaries are processed via a stack of (target dict, source dict, shorten) instead of recursion;
+        # only the top level gets shortened
+        stack = [(transformed_data, data, shorten)]
+        while stack:
+            target, source, shorten_level = stack.pop()
+            for key, value in source.items():
+                value_type = type(value)
+                if value_type in JSON_NATIVE_TYPES:
+                    if json_export and value_type is float and not math.isfinite(value):
+                        # JSON has no NaN or infinity
+                        target[key] = None
+                    else:
+                        target[key] = value
+                elif value_type in JSON_CONVERTERS:
+                    target[key] = JSON_CONVERTERS[value_type](value)
+                elif isinstance(value, np.ndarray):
+                    if value.ndim == 0:
+                        # 0-d arrays hold a single scalar (and have no len())
+                        target[key] = value.item()
+                    elif shorten_level and (len(value) > PREVIEW_NUM_VALUES):
+                        head = value[:PREVIEW_NUM_VALUES]
+                        if head.dtype.kind in "iu":
+                            # str() of native Python ints is faster than on numpy scalars
+                            head_strs = map(str, head.tolist())
+                        else:
+                            # numpy's string cast keeps the float32 representation (tolist() would widen to float64)
+                            head_strs = head.astype(str).tolist()
+                        target[key] = ",".join(head_strs) + "..."
+                    elif json_export:
+                        # float32 values are written at float64 precision, as tolist() would do
+                        target[key] = value.astype(np.float64, copy=False) if value.dtype.kind == "f" else value
+                    else:
+                        target[key] = value.tolist()
+                elif isinstance(value, uuid.UUID):
+                    target[key] = str(value)
+                elif isinstance(value, (date, datetime)):
+                    target[key] = value.isoformat()
+                elif isinstance(value, Dict):
+                    target[key] = {}
+                    stack.append((target[key], value, False))
                 else:
-                    transformed_data[key] = value.tolist()
-            elif isinstance(value, uuid.UUID):
-                transformed_data[key] = str(value)
-            elif isinstance(value, (date, datetime)):
-                transformed_data[key] = value.isoformat()
-            elif isinstance(value, Dict):
-                transformed_data[key] = self.transform_data(value, False)
-            else:
-                transformed_data[key] = value
+                    target[key] = value
         return transformed_data
 
 
@@ -795,13 +1297,18 @@ class Pod5Viewer(QMainWindow):
         Returns:
             None
         """
-        if self.data_tab_viewer.count() > 0:
+        if self.data_tab_viewer.count() > 0 and self.active_read_data is not None:
             read_id = self.data_tab_viewer.tabText(self.data_tab_viewer.currentIndex())
+            try:
+                # the signal is handed over as the ndarray itself, the viewer only reads the cells that are shown
+                data = self.data_handler.get_signal(self.active_read_data, in_pa)
+            except ValueError as e:
+                self.show_signal_error(read_id, e)
+                return
 
             if self.data_view_window:
                 self.data_view_window.close()
 
-            data = self.opened_read_data[read_id]["signal" if not in_pa else "signal_pa"]
             self.data_view_window = ArrayTableViewer(data, read_id=read_id, in_pa=in_pa)
             self.data_view_window.setWindowIcon(self.icon)
             self.data_view_window.show()
@@ -819,13 +1326,18 @@ class Pod5Viewer(QMainWindow):
         """
         if self.data_tab_viewer.count() > 0:
             if single:
-                read_ids = [self.data_tab_viewer.tabText(self.data_tab_viewer.currentIndex())]
+                tab_indices = [self.data_tab_viewer.currentIndex()]
             else:
-                read_ids = [self.data_tab_viewer.tabText(i) for i in range(self.data_tab_viewer.count())]
+                tab_indices = range(self.data_tab_viewer.count())
 
             plot_data = {}
-            for read_id in read_ids:
-                plot_data[read_id] = self.opened_read_data[read_id]["signal" if not in_pa else "signal_pa"]
+            for i in tab_indices:
+                read_id = self.data_tab_viewer.tabText(i)
+                try:
+                    plot_data[read_id] = self.data_handler.get_signal(self.opened_read_data[read_id], in_pa)
+                except ValueError as e:
+                    self.show_signal_error(read_id, e)
+                    return
 
             if self.plot_window:
                 self.plot_window.close()
@@ -838,11 +1350,21 @@ class Pod5Viewer(QMainWindow):
 
     def clear_viewer(self) -> None:
         """
-        Clears the data viewer by setting the model to an empty QStandardItemModel.
+        Clears the data viewer by removing all tabs and the data of all opened reads.
         """
-        self.model = QStandardItemModel()
+        self.preview_timer.stop()
+        self.preview_generation += 1
+        self.read_load_pool.clear()
+        tab_widgets = [self.data_tab_viewer.widget(i) for i in range(self.data_tab_viewer.count())]
         self.data_tab_viewer.clear()
-        self.opened_read_data = {}
+        # QTabWidget.clear does not delete the widgets of the tabs
+        for tab_widget in tab_widgets:
+            tab_widget.deleteLater()
+        self.clear_tab_cache()
+        self.opened_read_data.clear()
+        self.transformed_data_cache.clear()
+        self.proper_tabs.clear()
+        self.preview_tab = None
         self.plot_window = None
         self.file_navigator.clear()
 
@@ -853,6 +1375,17 @@ class Pod5Viewer(QMainWindow):
         QMessageBox.warning(self, "No read opened", 
             "A read must be opened to perform this action. Load and access at least one read.")
 
+    def show_signal_error(self, read_id: str, error: Exception) -> None:
+        """
+        Shows an error message if the signal of a read is needed, but could not be loaded or
+        converted to pA.
+
+        Args:
+            read_id (str): ID of the read.
+            error (Exception): The error raised by DataHandler.get_signal.
+        """
+        QMessageBox.critical(self, "Signal error", f"The signal of read {read_id} is not available. {error}.")
+
 
 def main() -> None:
     app = QApplication(sys.argv)
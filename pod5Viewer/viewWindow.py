@@ -23,18 +23,24 @@ class NumpyTableModel(QAbstractTableModel):
     The `NumpyTableModel` class acts as a bridge between NumPy arrays and Qt's table view.
     It allows NumPy data to be displayed efficiently in a tabular format, with support
     for row and column headers. The model also supports rounding of displayed numerical
-    data.
+    data. The texts of all cells are created at once with NumPy when the model is 
+    created (the model only holds the cells shown in the window), so requests of the 
+    view are answered with a list lookup.
 
     Attributes:
         _data (np.ndarray): The NumPy array containing the table data.
+        _cell_texts (List[List[str]]): The text of each cell, rounded for float arrays. Cells 
+            after the last value (padding of the last bin) are empty.
         _rownames (List[int]): The list of row indices used as row headers.
         _columnnames (List[int]): The list of column indices used as column headers.
 
     Methods:
         __init__(data, rownames, columnnames, parent): Initializes the model with NumPy data and optional headers.
+        set_data(data, rownames, columnnames, num_values): Replaces the shown data and headers.
         __get_header(names, data_shape): Helper method to generate default headers or use provided ones.
         rowCount(parent): Returns the number of rows in the model (corresponding to the data's shape).
         columnCount(parent): Returns the number of columns in the model (corresponding to the data's shape).
+        __get_cell_texts(data, num_values): Helper method to convert all values to (rounded) strings.
         data(index, role): Returns the data to be displayed at a given index, rounded to a specified number of decimals.
         headerData(section, orientation, role): Returns the appropriate header for the given section (row or column).
     """
@@ -49,7 +55,38 @@ class NumpyTableModel(QAbstractTableModel):
             parent: The parent object, if any. Defaults to None.
         """
         super().__init__()
+        self.__set_fields(data, rownames, columnnames)
+
+    def set_data(self, data: np.ndarray, rownames: List[int]|None = None, columnnames: List[int]|None = None, 
+                 num_values: int|None = None) -> None:
+        """
+        Replaces the shown data and headers, so one model can be used for all bins. If the
+        shape stays the same, the view is only notified that all cells and row headers changed.
+        Otherwise the model is reset.
+
+        Args:
+            data (np.ndarray): The data to display, stored as a NumPy array.
+            rownames (List[int], optional): A list of integers for the row headers. Defaults to None.
+            columnnames (List[int], optional): A list of integers for the column headers. Defaults to None.
+            num_values (int, optional): Number of values (in row-major order) that are shown. The 
+                remaining cells are padding and stay empty. Defaults to None (all cells are shown).
+        """
+        if data.shape != self._data.shape:
+            self.beginResetModel()
+            self.__set_fields(data, rownames, columnnames, num_values)
+            self.endResetModel()
+            return
+        self.__set_fields(data, rownames, columnnames, num_values)
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount()-1, self.columnCount()-1))
+        self.headerDataChanged.emit(Qt.Orientation.Vertical, 0, self.rowCount()-1)
+
+    def __set_fields(self, data: np.ndarray, rownames: List[int]|None, columnnames: List[int]|None, 
+                     num_values: int|None = None) -> None:
+        """
+        Stores the data, the cell texts and the headers.
+        """
         self._data = data
+        self._cell_texts = self.__get_cell_texts(data, num_values)
         self._rownames = self.__get_header(rownames, self.rowCount())
         self._columnnames = self.__get_header(columnnames, self.rowCount())
 
@@ -72,6 +109,30 @@ class NumpyTableModel(QAbstractTableModel):
                 return names
         return [i for i in range(data_shape)]
 
+    def __get_cell_texts(self, data: np.ndarray, num_values: int|None = None) -> List[List[str]]:
+        """
+        Converts all values to strings in a single NumPy call. Floats are rounded to 
+        NUM_DECIMALS decimals (as double precision) first, which gives the same texts as 
+        rounding each value with Python's round.
+
+        Args:
+            data (np.ndarray): The 2D table data.
+            num_values (int | None): Number of values (in row-major order) that are shown. 
+                None if all cells are shown.
+
+        Returns:
+            List[List[str]]: The text of each cell.
+        """
+        # the type of the values is the same for all cells, so it is only checked once
+        if np.issubdtype(data.dtype, np.floating):
+            data = np.round(data.astype(float), NUM_DECIMALS)
+        if num_values is None or num_values >= data.size:
+            return data.astype(str).tolist()
+
+        texts = data.reshape(-1)[:num_values].astype(str).tolist() + [""] * (data.size - num_values)
+        num_cols = data.shape[1]
+        return [texts[i:i+num_cols] for i in range(0, len(texts), num_cols)]
+
     def rowCount(self, parent: QModelIndex | QPersistentModelIndex | None = None):
         """
         Returns the number of rows in the data.
@@ -115,12 +176,8 @@ class NumpyTableModel(QAbstractTableModel):
             return None
 
         if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-            value = self._data[index.row(), index.column()]
             # display only the rounded data
-            if isinstance(value, (float, np.float64, np.float32)): # type: ignore issue seems to be because is numpy types
-                return f"{round(value, NUM_DECIMALS)}"
-            else:
-                return str(value)
+            return self._cell_texts[index.row()][index.column()]
         return None
 
     def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
@@ -163,6 +220,10 @@ class ArrayTableViewer(QMainWindow):
         num_cols (int): Number of columns currently visible in the table.
         bin_size (int): The number of elements in each bin.
         n_bins (int): Total number of bins in which the data is split.
+        row_offsets (np.ndarray): Offset of the first value of each row from the start of a bin.
+        table_model (NumpyTableModel): Model of the table widget. Shared by all bins.
+        bin_buffer (np.ndarray): Array of bin_size elements the shown bin is copied into. Has the 
+            dtype of the data and is allocated once per table size instead of once per shown bin.
 
     Methods:
         init_shortcuts(): Initializes keyboard shortcuts (e.g., closing window with CTRL+Q).
@@ -190,6 +251,9 @@ class ArrayTableViewer(QMainWindow):
     num_cols: int
     bin_size: int
     n_bins: int
+    row_offsets: np.ndarray
+    table_model: NumpyTableModel
+    bin_buffer: np.ndarray
 
     def __init__(self, data: np.ndarray, read_id: str, in_pa: bool = False):
         """
@@ -197,7 +261,8 @@ class ArrayTableViewer(QMainWindow):
         read ID and whether the signal is in pA.
 
         Args:
-            data (np.ndarray): full signal that should be displayed
+            data (np.ndarray): full signal that should be displayed. Must be passed as an array 
+                (not a list); only the bin that is currently shown is sliced from it.
             read_id (str): read ID corresponding to the signal
             in_pa (bool): True if the data is in pA
         """
@@ -208,12 +273,15 @@ class ArrayTableViewer(QMainWindow):
         self.read_id = read_id
         self.in_pa = in_pa
 
-        self.full_data = data
-        self.full_data_len = len(data)
+        # no copy is made if the data already is a contiguous array (as is the case for signals loaded from pod5)
+        self.full_data = np.ascontiguousarray(data)
+        self.full_data_len = len(self.full_data)
 
         if self.full_data_len < 1:
             QMessageBox.critical(self, "Invalid data", "Empty data was provided.")
 
+        # allocated with the size of a bin once the table size is known
+        self.bin_buffer = np.empty(0)
         self.initUI()
 
     def init_shortcuts(self) -> None:
@@ -253,6 +321,8 @@ class ArrayTableViewer(QMainWindow):
         self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table_widget.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table_widget.installEventFilter(self)
+        self.table_model = NumpyTableModel(np.empty((0, 0)))
+        self.table_widget.setModel(self.table_model)
         self.update_bin_attr()
         self.update_table()
 
@@ -286,10 +356,10 @@ class ArrayTableViewer(QMainWindow):
         Updates the table to the bin at the given index. Calculates the start and end index
         in the full data array. If the given bin is the last one of the data, the number of
         elements in the bin likely do not fit perfectly in the bin. If that is the case, the
-        given data is padded with NAs at the end to reach the wanted bin size. 
-        The (padded) chunk of the full data corresponding to the wanted bin is reshaped to
-        fit the current number of rows and columns, the reshaped array is implemented into
-        the model and shown in the table widget.
+        remaining cells of the table stay empty. The chunk is copied into the bin_buffer, 
+        so no new array is allocated and the data keeps its type.
+        The chunk of the full data corresponding to the wanted bin is reshaped to
+        fit the current number of rows and columns and handed to the table_model.
 
         Args:
             bin_idx (int): index of the bin that should be shown 
@@ -300,17 +370,13 @@ class ArrayTableViewer(QMainWindow):
         start_idx = bin_idx*self.bin_size
         end_idx = min((bin_idx+1)*self.bin_size, self.full_data_len)
 
-        data_subset = self.full_data[start_idx:end_idx].astype(float)
-
-        if data_subset.size < self.bin_size:
-            padded_size = self.bin_size - data_subset.size
-            data_subset = np.pad(data_subset, (0, padded_size), constant_values=np.nan)
+        num_values = end_idx - start_idx
+        self.bin_buffer[:num_values] = self.full_data[start_idx:end_idx]
 
-        data_subset = data_subset.reshape(self.num_rows, self.num_cols)
-        row_indices = [start_idx+i*self.num_cols for i in range(self.num_rows)]
+        data_subset = self.bin_buffer.reshape(self.num_rows, self.num_cols)
+        row_indices = (start_idx + self.row_offsets).tolist()
 
-        model = NumpyTableModel(data_subset, rownames=row_indices)
-        self.table_widget.setModel(model)
+        self.table_model.set_data(data_subset, rownames=row_indices, num_values=num_values)
 
     def update_bin_attr(self) -> None:
         """
@@ -323,6 +389,9 @@ class ArrayTableViewer(QMainWindow):
 
         self.bin_size = self.num_rows * self.num_cols
         self.n_bins = math.ceil(self.full_data_len / self.bin_size)
+        self.row_offsets = np.arange(self.num_rows) * self.num_cols
+        if self.bin_buffer.size != self.bin_size:
+            self.bin_buffer = np.empty(self.bin_size, dtype=self.full_data.dtype)
 
     def eventFilter(self, watched, event):
         """